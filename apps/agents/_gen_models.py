@@ -0,0 +1,40 @@
+"""
+Shared, cached listing of Gemini models that support generateContent
+Used by the model-listing dev scripts so a session makes one list_models() round-trip
+"""
+import functools
+from typing import Any, Dict, List
+import google.generativeai as genai
+from _paths import cache_dir
+from tools.cache import JsonDiskCache
+
+MODELS_CACHE_DIR = cache_dir("models")
+MODELS_CACHE_TTL = 24 * 60 * 60  # 24 hours
+_MODELS_CACHE_KEY = "generate_content_models"
+
+_models_cache = JsonDiskCache(MODELS_CACHE_DIR, MODELS_CACHE_TTL)
+
+
+@functools.lru_cache(maxsize=1)
+def list_generate_content_models() -> List[Dict[str, Any]]:
+    """
+    List models that support generateContent (genai must already be configured).
+
+    Returns:
+        List of dicts with name, display_name and supported_generation_methods
+    """
+    cached = _models_cache.get(_MODELS_CACHE_KEY)
+    if cached is not None:
+        return cached
+
+    models = [
+        {
+            "name": model.name,
+            "display_name": model.display_name,
+            "supported_generation_methods": list(model.supported_generation_methods),
+        }
+        for model in genai.list_models()
+        if 'generateContent' in model.supported_generation_methods
+    ]
+    _models_cache.set(_MODELS_CACHE_KEY, models)
+    return models
@@ -0,0 +1,36 @@
+"""
+Shared filesystem locations for the agents service and its dev scripts
+"""
+import os
+from pathlib import Path
+
+# careerpilot/.env (apps/agents/ is two levels below the project root)
+ENV_PATH = Path(__file__).resolve().parents[2] / ".env"
+
+
+def load_env(override: bool = False) -> None:
+    """
+    Load careerpilot/.env into os.environ.
+
+    Containerized deployments inject env vars directly and set
+    CAREERPILOT_USE_DOTENV=0; dotenv is then never imported.
+    """
+    if os.getenv("CAREERPILOT_USE_DOTENV", "1") != "1":
+        return
+
+    from dotenv import load_dotenv
+    load_dotenv(dotenv_path=ENV_PATH, override=override)
+
+
+# On-disk API / LLM response caches share one root (careerpilot/data/cache is gitignored)
+DEFAULT_CACHE_ROOT = ENV_PATH.parent / "data" / "cache"
+
+
+def cache_dir(name: str) -> Path:
+    """
+    Directory for one on-disk cache under the shared cache root.
+
+    CAREERPILOT_CACHE_DIR overrides the root; it is read at call time,
+    so call this after load_env().
+    """
+    return Path(os.getenv("CAREERPILOT_CACHE_DIR", DEFAULT_CACHE_ROOT)) / name
@@ -1,7 +1,9 @@
 """
 Base agent class using Google Generative AI (Gemini)
 """
+import asyncio
 import os
+import re
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
 from dotenv import load_dotenv
@@ -9,6 +11,9 @@ import google.generativeai as genai
 
 load_dotenv()
 
+# Leading ``` / ```json fence and everything after the closing fence
+_CODE_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*(?:```|$)", re.S)
+
 
 class BaseAgent(ABC):
     """Base class for all CareerPilot agents"""
@@ -82,6 +87,21 @@ class BaseAgent(ABC):
 
         return response.text
 
+    @staticmethod
+    def _strip_code_fences(text: str) -> str:
+        """
+        Strip a markdown code fence wrapped around a model response
+
+        Args:
+            text: Raw model output
+
+        Returns:
+            Fenced body if the text starts with a fence, otherwise the stripped text
+        """
+        text = text.strip()
+        match = _CODE_FENCE_RE.match(text)
+        return match.group(1) if match else text
+
     @abstractmethod
     def run(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -95,5 +115,17 @@ class BaseAgent(ABC):
         """
         pass
 
+    async def run_async(self, input_data: Dict[str, Any]) -> Any:
+        """
+        Run the agent in a worker thread so independent agents can overlap
+
+        Args:
+            input_data: Input data for the agent
+
+        Returns:
+            Agent output (same as run)
+        """
+        return await asyncio.to_thread(self.run, input_data)
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(model={self.model_name})"
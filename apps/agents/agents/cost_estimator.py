@@ -84,8 +84,7 @@ class CostEstimatorAgent(BaseAgent):
 
         # Fallback to College Scorecard
         costs = get_college_costs(university_name)
-        tuition_key = "in_state_tuition" if in_state else "out_of_state_tuition"
-        scorecard_tuition = costs.get(tuition_key, 0)
+        scorecard_tuition = costs.in_state_tuition if in_state else costs.out_of_state_tuition
 
         # If scorecard returns 0 or null, use a reasonable default based on school type
         if scorecard_tuition > 0:
@@ -67,12 +67,7 @@ Be specific about MDC program codes. Consider Florida programs (Bright Futures,
         # Parse JSON response
         try:
             # Remove markdown code blocks if present
-            response = response.strip()
-            if response.startswith("```"):
-                response = response.split("```")[1]
-                if response.startswith("json"):
-                    response = response[4:]
-            response = response.strip()
+            response = self._strip_code_fences(response)
 
             profile_dict = json.loads(response)
             return ProfileData(**profile_dict)
@@ -84,12 +84,7 @@ For software: No required license.
 
         # Parse JSON
         try:
-            response = response.strip()
-            if response.startswith("```"):
-                response = response.split("```")[1]
-                if response.startswith("json"):
-                    response = response[4:]
-            response = response.strip()
+            response = self._strip_code_fences(response)
 
             data = json.loads(response)
 
@@ -242,9 +237,10 @@ For software: No required license.
             # Filter and rank transfer partners based on location preference
             all_partners = seed_data.get("transfer_partners", [])
 
-            # Remove duplicates by university name (improved normalization)
+            # Single pass over the partners: skip duplicates by normalized university name,
+            # score each new one, and bucket it for the location branches below
             seen_universities = set()
-            unique_partners = []
+            out_of_state, in_state, miami_schools, other_fl = [], [], [], []
             for t in all_partners:
                 uni_name = t.get("name", "").upper()
                 # Normalize: remove parentheses, "UNIVERSITY", "THE", extra spaces, commas
@@ -255,26 +251,32 @@ For software: No required license.
                     .strip())
 
                 # Skip if already seen
-                if uni_key not in seen_universities:
-                    seen_universities.add(uni_key)
-                    unique_partners.append(t)
+                if uni_key in seen_universities:
+                    continue
+                seen_universities.add(uni_key)
 
-            print(f"[PathwayResearch] Deduplicated: {len(all_partners)} -> {len(unique_partners)} unique universities")
+                # Add ranking score for sorting
+                t["_ranking_score"] = self._get_ranking_score(t.get("name", ""), ranking_data)
 
-            # Add ranking score to each partner for sorting
-            for partner in unique_partners:
-                uni_name = partner.get("name", "")
-                partner["_ranking_score"] = self._get_ranking_score(uni_name, ranking_data)
+                is_out_of_state = t.get("in_state") == False
+                (out_of_state if is_out_of_state else in_state).append(t)
+
+                partner_location = t.get("location", "")
+                if "Miami" in partner_location or "Coral Gables" in partner_location:
+                    miami_schools.append(t)
+                elif not is_out_of_state:
+                    other_fl.append(t)
+
+            print(f"[PathwayResearch] Deduplicated: {len(all_partners)} -> {len(seen_universities)} unique universities")
+
+            def by_ranking(x):
+                return x.get("_ranking_score", 0)
 
             # Location-based filtering with proper out-of-state support
             if location == "anywhere":
-                # Prioritize out-of-state elite schools by ranking
-                out_of_state = [t for t in unique_partners if t.get("in_state") == False]
-                in_state = [t for t in unique_partners if t.get("in_state") != False]
-
-                # Sort by ranking score (highest first)
-                out_of_state.sort(key=lambda x: x.get("_ranking_score", 0), reverse=True)
-                in_state.sort(key=lambda x: x.get("_ranking_score", 0), reverse=True)
+                # Prioritize out-of-state elite schools by ranking (highest first)
+                out_of_state.sort(key=by_ranking, reverse=True)
+                in_state.sort(key=by_ranking, reverse=True)
 
                 # Take ALL out-of-state + top 4 in-state for diversity
                 # This gives Gemini more options to choose from (prestige/cheapest/fastest)
@@ -283,18 +285,14 @@ For software: No required license.
 
             elif location == "florida":
                 # Only Florida schools, sorted by ranking
-                florida_schools = [t for t in unique_partners if t.get("in_state") != False]
-                florida_schools.sort(key=lambda x: x.get("_ranking_score", 0), reverse=True)
-                transfer_partners = florida_schools[:5]
-                print(f"[PathwayResearch] Location=florida: {len(florida_schools)} FL schools -> {len(transfer_partners)} selected")
+                in_state.sort(key=by_ranking, reverse=True)
+                transfer_partners = in_state[:5]
+                print(f"[PathwayResearch] Location=florida: {len(in_state)} FL schools -> {len(transfer_partners)} selected")
 
             else:  # miami or default
                 # Prioritize Miami-area schools, then other FL schools
-                miami_schools = [t for t in unique_partners if "Miami" in t.get("location", "") or "Coral Gables" in t.get("location", "")]
-                other_fl = [t for t in unique_partners if t.get("in_state") != False and "Miami" not in t.get("location", "") and "Coral Gables" not in t.get("location", "")]
-
-                miami_schools.sort(key=lambda x: x.get("_ranking_score", 0), reverse=True)
-                other_fl.sort(key=lambda x: x.get("_ranking_score", 0), reverse=True)
+                miami_schools.sort(key=by_ranking, reverse=True)
+                other_fl.sort(key=by_ranking, reverse=True)
 
                 transfer_partners = miami_schools[:3] + other_fl[:2]
                 print(f"[PathwayResearch] Location=miami: {len(miami_schools)} Miami schools, {len(other_fl)} other FL -> {len(transfer_partners)} selected")
@@ -4,7 +4,7 @@ SalaryOutlookAgent - Retrieves salary and job outlook data
 from typing import Dict, Any
 from .base import BaseAgent
 from schemas.roadmap_output import SalaryResult
-from tools.bls import get_bls_code_for_career, get_bls_occupation_data, get_job_outlook, calculate_roi
+from tools.bls import get_career_profile, get_bls_occupation_data, calculate_roi
 
 
 class SalaryOutlookAgent(BaseAgent):
@@ -74,10 +74,10 @@ class SalaryOutlookAgent(BaseAgent):
         # Get realistic career-specific fallback data
         fallback_data = self._get_career_salary_fallback(career)
 
-        # Map career to BLS occupation code
-        bls_code = get_bls_code_for_career(career)
+        # Map career to BLS occupation code and growth outlook in one lookup
+        profile = get_career_profile(career)
 
-        if not bls_code:
+        if profile is None:
             print(f"[SalaryOutlook] No BLS code found for {career}, using career-specific fallback: ${fallback_data['median']}")
             return SalaryResult(
                 occupation=career,
@@ -90,6 +90,7 @@ class SalaryOutlookAgent(BaseAgent):
             )
 
         # Get salary data from BLS API
+        bls_code = profile["occupation_code"]
         median_salary = None
         outlook = {}
         try:
@@ -97,7 +98,7 @@ class SalaryOutlookAgent(BaseAgent):
             median_salary = salary_data.get("median_annual_salary")
 
             # Get job outlook
-            outlook = get_job_outlook(bls_code)
+            outlook = profile
         except Exception as e:
             print(f"[SalaryOutlook] BLS API error: {e}, using career-specific fallback")
 
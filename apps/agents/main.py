@@ -1,18 +1,30 @@
 """
 FastAPI server for CareerPilot AI agents
 """
+import logging
 import os
-from pathlib import Path
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from dotenv import load_dotenv
+import google.generativeai as genai
 from orchestrator import OrchestratorAgent
 from schemas.quiz_input import QuizInput
+from _paths import load_env
 
 # Load .env from careerpilot/.env
-env_path = Path(__file__).parent.parent.parent / ".env"
-load_dotenv(dotenv_path=env_path)
+# Containerized deployments inject env vars directly; set CAREERPILOT_USE_DOTENV=0 to skip the file read
+load_env()
+
+# Orchestrator progress goes through logging; LOG_LEVEL=WARNING silences it in production
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper(), format="%(message)s")
+
+# API key availability is fixed for the lifetime of the process
+HEALTH_ENVIRONMENT = {
+    "gcp_project": os.getenv("GCP_PROJECT_ID") is not None,
+    "search_api": os.getenv("GOOGLE_SEARCH_API_KEY") is not None,
+    "scorecard_api": os.getenv("SCORECARD_API_KEY") is not None,
+    "bls_api": os.getenv("BLS_API_KEY") is not None
+}
 
 app = FastAPI(
     title="CareerPilot AI Agents",
@@ -29,7 +41,7 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize orchestrator
+# Initialize orchestrator (also configures the shared genai client used by the chat endpoints)
 orchestrator = OrchestratorAgent()
 
 
@@ -66,12 +78,7 @@ async def health():
             "cost_estimator": "ready",
             "salary_outlook": "ready"
         },
-        "environment": {
-            "gcp_project": os.getenv("GCP_PROJECT_ID") is not None,
-            "search_api": os.getenv("GOOGLE_SEARCH_API_KEY") is not None,
-            "scorecard_api": os.getenv("SCORECARD_API_KEY") is not None,
-            "bls_api": os.getenv("BLS_API_KEY") is not None
-        }
+        "environment": HEALTH_ENVIRONMENT
     }
 
 
@@ -90,8 +97,8 @@ async def generate_plan(request: PlanRequest):
         # Validate quiz data
         quiz = QuizInput(**request.quiz_data)
 
-        # Generate roadmap
-        roadmap = orchestrator.generate_roadmap(quiz.model_dump())
+        # Generate roadmap (independent agents run concurrently off the event loop)
+        roadmap = await orchestrator.generate_roadmap_async(quiz.model_dump())
 
         return PlanResponse(
             success=True,
@@ -160,15 +167,10 @@ async def chat(request: ChatRequest):
         AI-generated response
     """
     try:
-        import google.generativeai as genai
-
-        # Configure Google AI with API key
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
+        # The shared genai client is configured by the orchestrator; fail fast without a key
+        if not os.getenv("GEMINI_API_KEY"):
             raise ValueError("GEMINI_API_KEY not found in environment")
 
-        genai.configure(api_key=api_key)
-
         # Create model
         model = genai.GenerativeModel(
             "gemini-2.0-flash-exp",
@@ -203,15 +205,10 @@ async def chatbot(request: ChatbotRequest):
         AI-generated answer
     """
     try:
-        import google.generativeai as genai
-
-        # Configure Google AI with API key
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
+        # The shared genai client is configured by the orchestrator; fail fast without a key
+        if not os.getenv("GEMINI_API_KEY"):
             raise ValueError("GEMINI_API_KEY not found in environment")
 
-        genai.configure(api_key=api_key)
-
         # Build context-aware system prompt
         system_prompt = f"""You are CareerPilot AI, a helpful career guidance assistant.
 You are helping a student pursuing a career as a {request.career}."""
@@ -1,16 +1,221 @@
 """
 OrchestratorAgent - Coordinates all agents to generate complete roadmap
 """
-import json
+import asyncio
+import functools
+import logging
+import math
+import os
+import re
+import threading
+from collections import deque
 from datetime import datetime
-from typing import Dict, Any, List
+from operator import attrgetter
+from typing import Dict, Any, List, Mapping, Tuple
 from pathlib import Path as FilePath
+from types import MappingProxyType
+import orjson
+import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 from agents.intake_profiler import IntakeProfilerAgent
 from agents.pathway_research import PathwayResearchAgent
 from agents.cost_estimator import CostEstimatorAgent
 from agents.salary_outlook import SalaryOutlookAgent
 from schemas.quiz_input import QuizInput
-from schemas.roadmap_output import Roadmap, Path, Node, Edge, Citation, Step
+from schemas.roadmap_output import Roadmap, Path, Node, Edge, Citation, Step, PathBreakdown, PathRecommendations
+from _paths import cache_dir
+from tools._aio import run_sync
+from tools.cache import JsonDiskCache
+
+logger = logging.getLogger(__name__)
+
+# Gemini path recommendations are reused for equivalent inputs for a week
+GEMINI_CACHE_DIR = cache_dir("gemini_paths")
+GEMINI_CACHE_TTL = 7 * 24 * 60 * 60
+
+# Transient Gemini failures worth retrying before falling back to seed-data ranking.
+# Timeouts are not retried: a slow model should not hold up the user's request.
+GEMINI_RETRYABLE_ERRORS = (
+    google_exceptions.ResourceExhausted,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.InternalServerError,
+)
+
+# Per-call timeout and a process-wide cap on in-flight calls (keeps us under the RPM quota)
+GEMINI_TIMEOUT_SECONDS = 15
+_GEMINI_SEMAPHORE = threading.BoundedSemaphore(20)
+
+# Static part of the Gemini path-selection prompt. Sent as the system instruction
+# so each call only transmits the per-student profile and university data.
+PATH_SELECTION_INSTRUCTIONS = """Given the student inputs and the research results from all agents, recommend the optimal academic roadmap for:
+- Cheapest path
+- Fastest path
+- Most Prestigious path
+
+RULES:
+1. Consider tuition + housing + fees per city
+2. A Master's costs 1–2 years separately (calculated independently)
+3. A PhD costs 4–6 years separately (calculated independently)
+4. If location is "anywhere" or out-of-state, prefer out-of-state elite universities (MIT, Stanford, CMU, Berkeley, Georgia Tech)
+5. If location is "florida" or "miami", prefer Florida universities (UF, FIU, FSU, UCF, FAU)
+6. Use ranking_score and tier to rank university prestige (Tier 1 > Tier 2 > Tier 3)
+7. Cheapest path: Minimize total cost (tuition + housing), prefer in-state, budget-friendly options
+8. Fastest path: Minimize total years, may have higher cost if accelerated programs available
+9. Prestige path: Maximize tier and ranking_score, accept higher cost for better outcomes
+10. If Masters or PhD in goals, include them as SEPARATE steps with their own costs
+11. CRITICAL: The three paths MUST recommend different universities. Do NOT recommend the same school for all 3 paths.
+
+AVAILABLE UNIVERSITIES is a compact JSON array, one object per university:
+n = university name (copy it exactly), p = program, loc = city, fl = in-state (Florida) tuition applies,
+tier = 1-3, r = ranking_score, bs = total 2-year BS cost in USD (tuition + housing/living)
+
+OUTPUT FORMAT (strict JSON):
+{
+  "cheapest": {
+    "university": "Full University Name",
+    "program": "Degree Name",
+    "tier": 1-3,
+    "ranking_score": 100-400,
+    "estimated_bs_cost": total for 2 years BS including tuition + housing,
+    "estimated_ms_cost": total for MS if in goals (0 if not),
+    "estimated_phd_cost": total for PhD if in goals (0 if not),
+    "total_years": 4-10,
+    "reasoning": "Why this is the cheapest option"
+  },
+  "fastest": {
+    "university": "Different University Name",
+    "program": "Degree Name",
+    "tier": 1-3,
+    "ranking_score": 100-400,
+    "estimated_bs_cost": total,
+    "estimated_ms_cost": total if in goals,
+    "estimated_phd_cost": total if in goals,
+    "total_years": 3-8,
+    "reasoning": "Why this is the fastest option"
+  },
+  "prestige": {
+    "university": "Elite University Name (MIT/Stanford/CMU/Berkeley if out-of-state)",
+    "program": "Degree Name",
+    "tier": 1,
+    "ranking_score": 350-400,
+    "estimated_bs_cost": total,
+    "estimated_ms_cost": total if in goals,
+    "estimated_phd_cost": total if in goals,
+    "total_years": 4-10,
+    "reasoning": "Why this is the most prestigious option"
+  }
+}"""
+
+
+SEED_DIR = FilePath(__file__).resolve().parents[2] / "data" / "seed"
+
+
+# Career keyword rules, one alternation branch per rule in priority order. Each branch is a
+# lookahead anchored at the start, so the first rule whose keywords appear anywhere wins.
+_DEGREE_NAME_RE = re.compile(
+    r"(?=.*(?:software|developer|computer|programmer))(?P<cs>)"
+    r"|(?=.*mechanical)(?P<me>)"
+    r"|(?=.*(?:electrical|electronics))(?P<ee>)"
+    r"|(?=.*civil)(?P<ce>)"
+    r"|(?=.*(?:business|finance|account))(?P<biz>)"
+    r"|(?=.*nurs)(?P<nurse>)"
+    r"|(?=.*data)(?=.*scien)(?P<ds>)",
+    re.IGNORECASE | re.DOTALL
+)
+_DEGREE_NAMES = {
+    "cs": "Computer Science",
+    "me": "Mechanical Engineering",
+    "ee": "Electrical Engineering",
+    "ce": "Civil Engineering",
+    "biz": "Business Administration",
+    "nurse": "Nursing",
+    "ds": "Data Science",
+}
+
+_CAREER_KEY_RE = re.compile(
+    r"(?=.*(?:mechanical|mae))(?P<me>)"
+    r"|(?=.*(?:electrical|eee))(?P<ee>)"
+    r"|(?=.*civil)(?P<ce>)"
+    r"|(?=.*(?:software|computer science))(?P<swe>)"
+    r"|(?=.*nurs)(?P<nurse>)"
+    r"|(?=.*architect)(?P<arch>)"
+    r"|(?=.*account)(?P<acct>)"
+    r"|(?=.*data)(?P<ds>)",
+    re.IGNORECASE | re.DOTALL
+)
+_CAREER_KEYS = {
+    "me": "Mechanical Engineer",
+    "ee": "Electrical Engineer",
+    "ce": "Civil Engineer",
+    "swe": "Software Developer",
+    "nurse": "Registered Nurse",
+    "arch": "Architect",
+    "acct": "Accountant",
+    "ds": "Data Scientist",
+}
+
+
+# License attributes read for each graph node, fetched in one call
+_LICENSE_NODE_FIELDS = attrgetter("name", "state", "timing", "url")
+
+# Florida university abbreviations used as ranking keys, in match priority order
+_UNIVERSITY_ABBREVS = ("UF", "UM", "FSU", "UCF", "FAU", "FIU", "USF")
+_UNIVERSITY_ABBREV_RE = re.compile(
+    "|".join(f"(?=.*?{abbrev})(?P<{abbrev}>)" for abbrev in _UNIVERSITY_ABBREVS),
+    re.DOTALL
+)
+
+# Shared read-only ranking for universities missing from the seed data
+_DEFAULT_RANKING = MappingProxyType({"tier": 3, "ranking_label": "Regional University"})
+
+
+def _parse_duration_years(duration: str) -> float:
+    """Leading year count of a free-text duration ("2 years", "4-6 years"), or 0 if none"""
+    if "year" not in duration:
+        return 0.0
+    try:
+        return float(duration.split()[0].split("-")[0])
+    except (ValueError, IndexError):
+        return 0.0
+
+
+def _phd_cost(yearly_living: float, years: float) -> float:
+    """
+    Out-of-pocket PhD cost: tuition is waived and the stipend covers ~70% of living.
+
+    Args:
+        yearly_living: Yearly rent + food + transport for the campus city
+        years: Program length in years
+
+    Returns:
+        Unrounded total cost
+    """
+    out_of_pocket_yearly = yearly_living * 0.3
+    books_fees = 800 + 500  # Research materials + conferences
+    return (out_of_pocket_yearly + books_fees) * years
+
+
+def _gemini_api_keys() -> List[str]:
+    """API keys for path selection: GEMINI_API_KEYS (comma-separated) or GEMINI_API_KEY"""
+    keys = [key.strip() for key in os.getenv("GEMINI_API_KEYS", "").split(",") if key.strip()]
+    return keys or [os.getenv("GEMINI_API_KEY")]
+
+
+def _log_gemini_retry(retry_state) -> None:
+    """tenacity before_sleep hook: log the failed attempt (429s rotate the key in _call_gemini)"""
+    logger.warning("[Orchestrator] [WARN] Gemini call failed (attempt %d): %s",
+                   retry_state.attempt_number, retry_state.outcome.exception())
+
+
+@functools.lru_cache(maxsize=None)
+def _load_seed_file(filename: str) -> Dict[str, Any]:
+    """Load a seed JSON file once; the parsed data is shared read-only by all orchestrators"""
+    try:
+        with open(SEED_DIR / filename, 'rb') as f:
+            return orjson.loads(f.read())
+    except Exception:
+        return {}
 
 
 class OrchestratorAgent:
@@ -21,36 +226,146 @@ class OrchestratorAgent:
         self.pathway_researcher = PathwayResearchAgent()
         self.cost_estimator = CostEstimatorAgent()
         self.salary_outlooker = SalaryOutlookAgent()
+        self._gemini_cache = JsonDiskCache(GEMINI_CACHE_DIR, GEMINI_CACHE_TTL)
+
+        # Gemini path-selection client, configured once and reused across requests
+        # Roadmaps run concurrently on one orchestrator, so key/model swaps happen under a lock
+        self._gemini_lock = threading.Lock()
+        self._gemini_keys = deque(_gemini_api_keys())
+        self._gemini = self._build_gemini_model()
 
         # Load seed data for enhancements
         self._load_seed_data()
 
-    def _load_seed_data(self):
-        """Load enhancement seed data files"""
-        seed_dir = FilePath(__file__).parent.parent.parent.parent / "data" / "seed"
+    def _build_gemini_model(self):
+        """Configure genai with the current API key and build the path-selection model"""
+        # genai.configure is process-global: models created afterwards (including the
+        # /api/chat and /api/chatbot ones) use this key too. A model binds its client on
+        # first call, so the path-selection model is rebuilt after every configure.
+        genai.configure(api_key=self._gemini_keys[0])
+        return genai.GenerativeModel(
+            "gemini-2.0-flash-exp",
+            system_instruction=PATH_SELECTION_INSTRUCTIONS,
+            generation_config={
+                "response_mime_type": "application/json",
+                "response_schema": PathRecommendations
+            }
+        )
 
-        # Load housing costs
-        try:
-            with open(seed_dir / "housing_costs.json", 'r') as f:
-                self.housing_data = json.load(f)
-        except:
-            self.housing_data = {}
+    def _rotate_gemini_key(self, failed_key: str):
+        """
+        Move past a rate-limited API key (no-op with a single key)
 
-        # Load internships and research opportunities
-        try:
-            with open(seed_dir / "internships_research.json", 'r') as f:
-                self.internship_data = json.load(f)
-        except:
-            self.internship_data = {}
+        Args:
+            failed_key: Key used by the attempt that got the 429; if another call
+                already rotated away from it, the current key is kept
+        """
+        with self._gemini_lock:
+            if len(self._gemini_keys) < 2 or self._gemini_keys[0] != failed_key:
+                return
+            self._gemini_keys.rotate(-1)
+            self._gemini = self._build_gemini_model()
+        logger.info("[Orchestrator] Rotated to next Gemini API key")
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=0.5, max=4),
+        retry=retry_if_exception_type(GEMINI_RETRYABLE_ERRORS),
+        before_sleep=_log_gemini_retry,
+        reraise=True
+    )
+    def _call_gemini(self, prompt: str) -> str:
+        """
+        Send a path-selection prompt to Gemini, retrying transient errors
+
+        Args:
+            prompt: Per-student prompt (rules travel as the system instruction)
+
+        Returns:
+            Raw JSON response text
+        """
+        # Read key and model together so a 429 is charged to the key this attempt used
+        with self._gemini_lock:
+            api_key, model = self._gemini_keys[0], self._gemini
 
-        # Load university rankings
         try:
-            with open(seed_dir / "university_rankings.json", 'r') as f:
-                self.ranking_data = json.load(f)
-        except:
-            self.ranking_data = {}
+            with _GEMINI_SEMAPHORE:
+                # Stream so chunks are received while the model is still generating
+                stream = model.generate_content(
+                    prompt,
+                    stream=True,
+                    request_options={"timeout": GEMINI_TIMEOUT_SECONDS}
+                )
+                chunks = [chunk.text for chunk in stream]
+        except google_exceptions.ResourceExhausted:
+            self._rotate_gemini_key(api_key)
+            raise
+        logger.debug("[Orchestrator] Gemini streamed %d chunks", len(chunks))
+        return "".join(chunks)
+
+    def _load_seed_data(self):
+        """Load enhancement seed data files (parsed once per process)"""
+        self.housing_data = _load_seed_file("housing_costs.json")
+        self.internship_data = _load_seed_file("internships_research.json")
+        # Copies flagged with in-state (Florida) tuition eligibility, so hot paths skip the location scan
+        self.ranking_data = {
+            university: {**ranking, "is_in_state": "FL" in ranking.get("location", "")}
+            for university, ranking in _load_seed_file("university_rankings.json").items()
+        }
+        # Per-instance memo of name -> ranking (abbreviated names resolve through a regex scan)
+        self._ranking_cache: Dict[str, Mapping[str, Any]] = {}
+
+        # Yearly rent + food + transport per city, computed once instead of per university
+        self._yearly_housing = {
+            location: (housing.get("avg_rent_shared", 1000) +
+                       housing.get("avg_food", 350) +
+                       housing.get("avg_transport", 100)) * 12
+            for location, housing in self.housing_data.items()
+        }
+        # PhD cost depends only on location; precomputed for the standard 5-year program
+        self._phd_cost_5yr = {
+            location: round(_phd_cost(yearly_living, 5), 2)
+            for location, yearly_living in self._yearly_housing.items()
+        }
+        # Graduate cost estimates keyed by (university, degree type, years); derived from the tables above
+        self._grad_cost_cache: Dict[Tuple[str, str, float], float] = {}
 
     def generate_roadmap(self, quiz_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Generate complete roadmap from quiz data (blocking wrapper)
+
+        Args:
+            quiz_data: User quiz responses
+
+        Returns:
+            Complete Roadmap with paths, nodes, edges, citations
+        """
+        return run_sync(self.generate_roadmap_async(quiz_data))
+
+    def generate_roadmap_batch(self, quiz_data_list: List[Dict[str, Any]], max_concurrency: int = 8) -> List[Dict[str, Any]]:
+        """
+        Generate roadmaps for many students (CSV imports, nightly refreshes)
+
+        Args:
+            quiz_data_list: Quiz responses, one per student
+            max_concurrency: Maximum roadmaps generated at the same time
+
+        Returns:
+            Roadmaps in the same order as quiz_data_list
+        """
+        return run_sync(self.generate_roadmap_batch_async(quiz_data_list, max_concurrency))
+
+    async def generate_roadmap_batch_async(self, quiz_data_list: List[Dict[str, Any]], max_concurrency: int = 8) -> List[Dict[str, Any]]:
+        """Async version of generate_roadmap_batch"""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def generate_one(quiz_data):
+            async with semaphore:
+                return await self.generate_roadmap_async(quiz_data)
+
+        return await asyncio.gather(*(generate_one(quiz_data) for quiz_data in quiz_data_list))
+
+    async def generate_roadmap_async(self, quiz_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Generate complete roadmap from quiz data
 
@@ -62,60 +377,93 @@ class OrchestratorAgent:
 
         Flow:
             1. IntakeProfilerAgent → Profile
-            2. PathwayResearchAgent → MDC programs, transfers, licenses
-            3. CostEstimatorAgent → Cost breakdowns for 3 paths
-            4. SalaryOutlookAgent → Salary, ROI
-            5. Synthesize → Complete roadmap
+            2. In parallel:
+               a. PathwayResearchAgent → MDC programs, transfers, licenses
+                  then CostEstimatorAgent → Cost breakdowns for 3 paths
+               b. SalaryOutlookAgent → Salary, ROI
+            3. Gemini → Optimal university per path
+            4. Synthesize → Complete roadmap
         """
-        print(f"[Orchestrator] Starting roadmap generation for: {quiz_data.get('career')}")
+        career = quiz_data.get("career")
+        location = quiz_data.get("location", "miami")
+        goals = quiz_data.get("goals", [])
+        budget = quiz_data.get("budget", "medium")
+        gpa = quiz_data.get("gpa", 3.0)
+
+        logger.info("[Orchestrator] Starting roadmap generation for: %s", career)
 
         # Step 1: Profile analysis
-        print("[Orchestrator] Step 1: Profiling student...")
-        profile = self.intake_profiler.run(quiz_data)
-        print(f"[Orchestrator] Profile: {profile.category} | Flags: {profile.flags}")
+        logger.info("[Orchestrator] Step 1: Profiling student...")
+        profile = await self.intake_profiler.run_async(quiz_data)
+        logger.info("[Orchestrator] Profile: %s | Flags: %s", profile.category, profile.flags)
+
+        # Steps 2-4: Pathway research feeds cost estimation; salary outlook only needs the profile
+        (pathway_result, cost_result), salary_result = await asyncio.gather(
+            self._research_and_estimate_costs(profile),
+            self._analyze_salary(profile)
+        )
+
+        # Ranking data for every transfer option, looked up once and shared by all helpers below
+        rankings = {
+            transfer.university: self._get_university_ranking(transfer.university)
+            for transfer in pathway_result.transfer_options
+        }
+
+        # Step 5: AI-Driven Path Selection via Gemini
+        logger.info("[Orchestrator] Step 5: Asking Gemini to recommend optimal paths...")
+        optimal_paths = await asyncio.to_thread(
+            self._get_gemini_path_recommendations,
+            profile, pathway_result, cost_result, salary_result, rankings, location, goals, budget, gpa
+        )
+        logger.info("[Orchestrator] Gemini recommended: Cheapest=%s, Fastest=%s, Prestige=%s",
+                    optimal_paths['cheapest']['university'], optimal_paths['fastest']['university'],
+                    optimal_paths['prestige']['university'])
+
+        # Step 6: Synthesize roadmap with AI recommendations
+        logger.info("[Orchestrator] Step 6: Synthesizing roadmap with AI choices...")
+        roadmap = self._synthesize_roadmap(
+            profile, pathway_result, cost_result, salary_result, goals, rankings, optimal_paths
+        )
+
+        logger.info("[Orchestrator] [OK] Roadmap complete: %d nodes, %d edges",
+                    len(roadmap['nodes']), len(roadmap['edges']))
+
+        return roadmap
+
+    async def _research_and_estimate_costs(self, profile) -> tuple:
+        """Run pathway research, then cost estimation on its results"""
+        # Both agents only read the profile, so one dump serves both
+        profile_dict = profile.model_dump()
 
         # Step 2: Pathway research
-        print("[Orchestrator] Step 2: Researching pathways...")
-        pathway_result = self.pathway_researcher.run(profile.model_dump())
-        print(f"[Orchestrator] Found {len(pathway_result.mdc_programs)} MDC programs, "
-              f"{len(pathway_result.transfer_options)} transfer options")
+        logger.info("[Orchestrator] Step 2: Researching pathways...")
+        pathway_result = await self.pathway_researcher.run_async(profile_dict)
+        logger.info("[Orchestrator] Found %d MDC programs, %d transfer options",
+                    len(pathway_result.mdc_programs), len(pathway_result.transfer_options))
 
         # Step 3: Cost estimation
-        print("[Orchestrator] Step 3: Estimating costs...")
-        cost_result = self.cost_estimator.run({
-            "profile": profile.model_dump(),
+        logger.info("[Orchestrator] Step 3: Estimating costs...")
+        cost_result = await self.cost_estimator.run_async({
+            "profile": profile_dict,
             "pathway_result": pathway_result.model_dump()
         })
-        print(f"[Orchestrator] Cheapest: ${cost_result.cheapest_path['total']:,.0f}, "
-              f"Prestige: ${cost_result.prestige_path['total']:,.0f}")
+        logger.info("[Orchestrator] Cheapest: $%.0f, Prestige: $%.0f",
+                    cost_result.cheapest_path.total, cost_result.prestige_path.total)
+
+        return pathway_result, cost_result
 
+    async def _analyze_salary(self, profile):
+        """Run salary outlook (independent of pathway research)"""
         # Step 4: Salary outlook
-        print("[Orchestrator] Step 4: Analyzing salary outlook...")
-        salary_result = self.salary_outlooker.run({
+        logger.info("[Orchestrator] Step 4: Analyzing salary outlook...")
+        salary_result = await self.salary_outlooker.run_async({
             "career": profile.career,
             "category": profile.category
         })
-        print(f"[Orchestrator] Median salary: ${salary_result.median_salary:,.0f}, "
-              f"ROI: {salary_result.roi_years:.1f} years")
-
-        # Step 5: AI-Driven Path Selection via Gemini
-        print("[Orchestrator] Step 5: Asking Gemini to recommend optimal paths...")
-        optimal_paths = self._get_gemini_path_recommendations(
-            profile, pathway_result, cost_result, salary_result, quiz_data
-        )
-        print(f"[Orchestrator] Gemini recommended: Cheapest={optimal_paths['cheapest']['university']}, "
-              f"Fastest={optimal_paths['fastest']['university']}, Prestige={optimal_paths['prestige']['university']}")
-
-        # Step 6: Synthesize roadmap with AI recommendations
-        print("[Orchestrator] Step 6: Synthesizing roadmap with AI choices...")
-        roadmap = self._synthesize_roadmap(
-            profile, pathway_result, cost_result, salary_result, quiz_data, optimal_paths
-        )
-
-        print(f"[Orchestrator] [OK] Roadmap complete: {len(roadmap['nodes'])} nodes, "
-              f"{len(roadmap['edges'])} edges")
+        logger.info("[Orchestrator] Median salary: $%.0f, ROI: %.1f years",
+                    salary_result.median_salary, salary_result.roi_years)
 
-        return roadmap
+        return salary_result
 
     def _get_gemini_path_recommendations(
         self,
@@ -123,138 +471,93 @@ class OrchestratorAgent:
         pathway_result,
         cost_result,
         salary_result,
-        quiz_data: Dict[str, Any]
+        rankings: Dict[str, Dict[str, Any]],
+        location_pref: str,
+        goals: List[str],
+        budget: str,
+        gpa: float
     ) -> Dict[str, Any]:
         """Use Gemini to intelligently choose optimal paths based on all collected data"""
-        import google.generativeai as genai
-        import os
-
-        # Configure Gemini
-        api_key = os.getenv("GEMINI_API_KEY")
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel("gemini-2.0-flash-exp")
-
-        # Prepare comprehensive data for Gemini
-        location_pref = quiz_data.get("location", "miami")
-        goals = quiz_data.get("goals", [])
-        budget = quiz_data.get("budget", "medium")
-
-        # Build meta-prompt
-        meta_prompt = f"""Given the student inputs below and the research results from all agents, recommend the optimal academic roadmap for:
-- Cheapest path
-- Fastest path
-- Most Prestigious path
-
-STUDENT PROFILE:
+        # Skip the LLM entirely when an equivalent request was answered recently
+        cache_key = self._gemini_cache_key(profile, pathway_result, location_pref, goals, budget, gpa)
+        cached = self._gemini_cache.get(cache_key)
+        if cached and self._validate_gemini_recommendations(cached):
+            logger.info("[Orchestrator] [OK] Using cached Gemini recommendations")
+            return cached
+
+        # Build meta-prompt (static rules/format travel as the system instruction)
+        meta_prompt = f"""STUDENT PROFILE:
 - Career Goal: {profile.career}
 - Category: {profile.category}
 - Location Preference: {location_pref}
 - Budget Priority: {budget}
 - Goals: {', '.join(goals)}
-- GPA: {quiz_data.get('gpa', 3.0)}
+- GPA: {gpa}
 
 AVAILABLE UNIVERSITIES:
-{self._format_universities_for_gemini(pathway_result, location_pref)}
+{self._format_universities_for_gemini(pathway_result, rankings)}
 
 COST DATA (for reference):
-- Cheapest Path Total: ${cost_result.cheapest_path['total']:,.0f}
-- Prestige Path Total: ${cost_result.prestige_path['total']:,.0f}
+- Cheapest Path Total: ${cost_result.cheapest_path.total:,.0f}
+- Prestige Path Total: ${cost_result.prestige_path.total:,.0f}
 
 SALARY DATA:
 - Expected Median Salary: ${salary_result.median_salary:,.0f}
 - ROI Years: {salary_result.roi_years}
 
-RULES:
-1. Consider tuition + housing + fees per city
-2. A Master's costs 1–2 years separately (calculated independently)
-3. A PhD costs 4–6 years separately (calculated independently)
-4. If location is "anywhere" or out-of-state, prefer out-of-state elite universities (MIT, Stanford, CMU, Berkeley, Georgia Tech)
-5. If location is "florida" or "miami", prefer Florida universities (UF, FIU, FSU, UCF, FAU)
-6. Use ranking_score and tier to rank university prestige (Tier 1 > Tier 2 > Tier 3)
-7. Cheapest path: Minimize total cost (tuition + housing), prefer in-state, budget-friendly options
-8. Fastest path: Minimize total years, may have higher cost if accelerated programs available
-9. Prestige path: Maximize tier and ranking_score, accept higher cost for better outcomes
-10. If Masters or PhD in goals, include them as SEPARATE steps with their own costs
-11. CRITICAL: The three paths MUST recommend different universities. Do NOT recommend the same school for all 3 paths.
-
-OUTPUT FORMAT (strict JSON):
-{{
-  "cheapest": {{
-    "university": "Full University Name",
-    "program": "Degree Name",
-    "tier": 1-3,
-    "ranking_score": 100-400,
-    "estimated_bs_cost": total for 2 years BS including tuition + housing,
-    "estimated_ms_cost": total for MS if in goals (0 if not),
-    "estimated_phd_cost": total for PhD if in goals (0 if not),
-    "total_years": 4-10,
-    "reasoning": "Why this is the cheapest option"
-  }},
-  "fastest": {{
-    "university": "Different University Name",
-    "program": "Degree Name",
-    "tier": 1-3,
-    "ranking_score": 100-400,
-    "estimated_bs_cost": total,
-    "estimated_ms_cost": total if in goals,
-    "estimated_phd_cost": total if in goals,
-    "total_years": 3-8,
-    "reasoning": "Why this is the fastest option"
-  }},
-  "prestige": {{
-    "university": "Elite University Name (MIT/Stanford/CMU/Berkeley if out-of-state)",
-    "program": "Degree Name",
-    "tier": 1,
-    "ranking_score": 350-400,
-    "estimated_bs_cost": total,
-    "estimated_ms_cost": total if in goals,
-    "estimated_phd_cost": total if in goals,
-    "total_years": 4-10,
-    "reasoning": "Why this is the most prestigious option"
-  }}
-}}
-
 Return ONLY the JSON, no additional text."""
 
         # Call Gemini
         try:
-            print(f"[Orchestrator] Calling Gemini with {len(meta_prompt)} chars...")
-            response = model.generate_content(meta_prompt)
-            response_text = response.text.strip()
+            logger.debug("[Orchestrator] Calling Gemini with %d chars...", len(meta_prompt))
+            response_text = self._call_gemini(meta_prompt)
 
-            # Log the full response for debugging
-            print(f"[Orchestrator] Gemini response length: {len(response_text)} chars")
+            logger.debug("[Orchestrator] Gemini response length: %d chars", len(response_text))
 
-            # Parse JSON response
-            import json
-            # Remove markdown code blocks if present
-            if response_text.startswith("```json"):
-                response_text = response_text.replace("```json", "").replace("```", "").strip()
-            elif response_text.startswith("```"):
-                response_text = response_text.replace("```", "").strip()
-
-            recommendations = json.loads(response_text)
+            # Schema-constrained output parses directly (no markdown fences to strip)
+            recommendations = PathRecommendations.model_validate_json(response_text).model_dump()
 
             # Validate recommendations
             if not self._validate_gemini_recommendations(recommendations):
-                print("[Orchestrator] [WARN] Gemini recommendations failed validation, using fallback")
-                return self._get_fallback_recommendations(pathway_result, location_pref)
+                logger.warning("[Orchestrator] [WARN] Gemini recommendations failed validation, using fallback")
+                return self._get_fallback_recommendations(pathway_result, rankings)
 
-            print(f"[Orchestrator] [OK] Gemini recommendations validated successfully")
+            logger.info("[Orchestrator] [OK] Gemini recommendations validated successfully")
+            self._gemini_cache.set(cache_key, recommendations)
             return recommendations
 
         except Exception as e:
-            print(f"[Orchestrator] [ERROR] Gemini call failed: {e}")
-            print(f"[Orchestrator] Using fallback recommendations")
-            return self._get_fallback_recommendations(pathway_result, location_pref)
+            logger.error("[Orchestrator] [ERROR] Gemini call failed: %s", e)
+            logger.info("[Orchestrator] Using fallback recommendations")
+            return self._get_fallback_recommendations(pathway_result, rankings)
+
+    def _gemini_cache_key(
+        self,
+        profile,
+        pathway_result,
+        location_pref: str,
+        goals: List[str],
+        budget: str,
+        gpa: float
+    ) -> Dict[str, Any]:
+        """Canonical description of the inputs that shape the Gemini meta-prompt"""
+        return {
+            "career": profile.career,
+            "category": profile.category,
+            "location": location_pref,
+            "budget": budget,
+            "goals": sorted(goals),
+            "gpa_bucket": math.floor(float(gpa) * 2) / 2,
+            "universities": [[t.university, t.program] for t in pathway_result.transfer_options]
+        }
 
-    def _format_universities_for_gemini(self, pathway_result, location_pref: str) -> str:
-        """Format university options with all relevant data for Gemini"""
+    def _format_universities_for_gemini(self, pathway_result, rankings: Dict[str, Dict[str, Any]]) -> str:
+        """Format university options as a compact JSON table (keys described in the instructions)"""
         universities = []
 
         # Send ALL transfer options to Gemini (not just top 8) for better selection
-        for i, transfer in enumerate(pathway_result.transfer_options):
-            ranking = self._get_university_ranking(transfer.university)
+        for transfer in pathway_result.transfer_options:
+            ranking = rankings[transfer.university]
             location = ranking.get("location", "Unknown")
 
             # Get cost data
@@ -262,28 +565,22 @@ Return ONLY the JSON, no additional text."""
             tuition_out = ranking.get("tuition_out_of_state", 25000)
 
             # Get housing data
-            housing = self.housing_data.get(location, {})
-            yearly_housing = (housing.get("avg_rent_shared", 1000) * 12 +
-                            housing.get("avg_food", 350) * 12 +
-                            housing.get("avg_transport", 100) * 12)
+            yearly_housing = self._yearly_housing.get(location, (1000 + 350 + 100) * 12)
 
-            is_in_state = "FL" in location
+            is_in_state = ranking.get("is_in_state", False)
             tuition = tuition_in if is_in_state else tuition_out
 
-            uni_data = f"""
-{i+1}. {transfer.university}
-   - Program: {transfer.program}
-   - Location: {location}
-   - In-State: {"Yes" if is_in_state else "No"}
-   - Tier: {ranking.get('tier', 3)}
-   - Ranking Score: {self._calculate_ranking_score(ranking)}
-   - Tuition (2 years): ${tuition * 2:,.0f}
-   - Housing/Living (2 years): ${yearly_housing * 2:,.0f}
-   - Total BS Cost: ${(tuition + yearly_housing) * 2:,.0f}
-   - URL: {transfer.url}"""
-            universities.append(uni_data)
-
-        return "\n".join(universities)
+            universities.append({
+                "n": transfer.university,
+                "p": transfer.program,
+                "loc": location,
+                "fl": is_in_state,
+                "tier": ranking.get("tier", 3),
+                "r": self._calculate_ranking_score(ranking),
+                "bs": round((tuition + yearly_housing) * 2)
+            })
+
+        return orjson.dumps(universities).decode()
 
     def _calculate_ranking_score(self, ranking: Dict[str, Any]) -> int:
         """Calculate ranking score (same formula as PathwayResearchAgent)"""
@@ -296,7 +593,7 @@ Return ONLY the JSON, no additional text."""
         try:
             # Check all three paths exist
             if not all(key in recommendations for key in ["cheapest", "fastest", "prestige"]):
-                print("[Orchestrator] [ERROR] Validation failed: Missing path recommendations")
+                logger.error("[Orchestrator] [ERROR] Validation failed: Missing path recommendations")
                 return False
 
             # Check universities are different
@@ -307,58 +604,49 @@ Return ONLY the JSON, no additional text."""
             ]
 
             if len(set(universities)) < 3:
-                print(f"[Orchestrator] [ERROR] Validation failed: Duplicate universities: {universities}")
+                logger.error("[Orchestrator] [ERROR] Validation failed: Duplicate universities: %s", universities)
                 return False
 
             # Check all paths have required fields
             for path_name, path in recommendations.items():
                 required_fields = ["university", "program", "tier", "estimated_bs_cost"]
                 if not all(field in path for field in required_fields):
-                    print(f"[Orchestrator] [ERROR] Validation failed: {path_name} missing required fields")
+                    logger.error("[Orchestrator] [ERROR] Validation failed: %s missing required fields", path_name)
                     return False
 
                 # Check reasonable cost values
                 if path["estimated_bs_cost"] <= 0 or path["estimated_bs_cost"] > 500000:
-                    print(f"[Orchestrator] [ERROR] Validation failed: {path_name} has unrealistic BS cost")
+                    logger.error("[Orchestrator] [ERROR] Validation failed: %s has unrealistic BS cost", path_name)
                     return False
 
             return True
 
         except Exception as e:
-            print(f"[Orchestrator] [ERROR] Validation error: {e}")
+            logger.error("[Orchestrator] [ERROR] Validation error: %s", e)
             return False
 
-    def _get_fallback_recommendations(self, pathway_result, location_pref: str) -> Dict[str, Any]:
+    def _get_fallback_recommendations(self, pathway_result, rankings_by_university: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
         """Fallback recommendations if Gemini fails - MUST use 3 different universities"""
         transfer_options = pathway_result.transfer_options
 
-        # Sort by ranking
-        ranked = []
-        for transfer in transfer_options:
-            ranking = self._get_university_ranking(transfer.university)
-            score = self._calculate_ranking_score(ranking)
-            location = ranking.get("location", "")
-            is_fl = "FL" in location
-            tuition_in = ranking.get("tuition_in_state", 10000)
-            tuition_out = ranking.get("tuition_out_of_state", 25000)
-            tuition = tuition_in if is_fl else tuition_out
-
-            ranked.append({
-                "transfer": transfer,
-                "ranking": ranking,
-                "score": score,
-                "is_fl": is_fl,
-                "tuition": tuition,
-                "location": location
-            })
+        # Parallel per-university columns (indexed like transfer_options) instead of a dict per row
+        universities = [t.university for t in transfer_options]
+        rankings = [rankings_by_university[u] for u in universities]
+        scores = [self._calculate_ranking_score(r) for r in rankings]
+        locations = [r.get("location", "") for r in rankings]
+        is_fl = [r.get("is_in_state", False) for r in rankings]
+        tuitions = [
+            r.get("tuition_in_state", 10000) if fl else r.get("tuition_out_of_state", 25000)
+            for r, fl in zip(rankings, is_fl)
+        ]
 
-        ranked.sort(key=lambda x: x["score"], reverse=True)
+        # Sort by ranking (indices, highest score first)
+        ranked = sorted(range(len(transfer_options)), key=scores.__getitem__, reverse=True)
 
         # CRITICAL: Ensure 3 DIFFERENT universities
 
         # Cheapest: Lowest cost Florida in-state school
-        fl_schools = [r for r in ranked if r["is_fl"]]
-        fl_schools.sort(key=lambda x: x["tuition"])
+        fl_schools = sorted((i for i in ranked if is_fl[i]), key=tuitions.__getitem__)
         cheapest = fl_schools[0] if fl_schools else ranked[-1]
 
         # Prestige: Highest ranked school (prefer out-of-state elite)
@@ -367,16 +655,15 @@ Return ONLY the JSON, no additional text."""
         # Fastest: Mid-tier option that's DIFFERENT from cheapest and prestige
         # Try to find a different FL school for fastest, or second-best prestige
         fastest = None
-        for r in ranked:
-            uni_name = r["transfer"].university
-            if uni_name != cheapest["transfer"].university and uni_name != prestige["transfer"].university:
-                fastest = r
+        for i in ranked:
+            if universities[i] != universities[cheapest] and universities[i] != universities[prestige]:
+                fastest = i
                 break
 
         # If we still don't have a third unique school, force it
-        if not fastest or len(set([cheapest["transfer"].university, fastest["transfer"].university, prestige["transfer"].university])) < 3:
+        if fastest is None or len({universities[cheapest], universities[fastest], universities[prestige]}) < 3:
             # Pick second FL school if cheapest is FL
-            if cheapest["is_fl"] and len(fl_schools) >= 2:
+            if is_fl[cheapest] and len(fl_schools) >= 2:
                 fastest = fl_schools[1]
             # Or pick second prestige if prestige is top
             elif len(ranked) >= 2:
@@ -385,44 +672,26 @@ Return ONLY the JSON, no additional text."""
                 fastest = cheapest  # Last resort
 
         # Calculate realistic costs
-        def calc_cost(r):
-            housing_data = self.housing_data.get(r["location"], {})
-            yearly_housing = (housing_data.get("avg_rent_shared", 1100) * 12 +
-                            housing_data.get("avg_food", 350) * 12 +
-                            housing_data.get("avg_transport", 100) * 12)
-            return (r["tuition"] + yearly_housing) * 2  # 2 years BS
-
-        return {
-            "cheapest": {
-                "university": cheapest["transfer"].university,
-                "program": cheapest["transfer"].program,
-                "tier": cheapest["ranking"].get("tier", 2),
-                "ranking_score": cheapest["score"],
-                "estimated_bs_cost": calc_cost(cheapest),
-                "estimated_ms_cost": 0,
-                "estimated_phd_cost": 0,
-                "total_years": 4
-            },
-            "fastest": {
-                "university": fastest["transfer"].university,
-                "program": fastest["transfer"].program,
-                "tier": fastest["ranking"].get("tier", 2),
-                "ranking_score": fastest["score"],
-                "estimated_bs_cost": calc_cost(fastest),
-                "estimated_ms_cost": 0,
-                "estimated_phd_cost": 0,
-                "total_years": 3.5
-            },
-            "prestige": {
-                "university": prestige["transfer"].university,
-                "program": prestige["transfer"].program,
-                "tier": prestige["ranking"].get("tier", 1),
-                "ranking_score": prestige["score"],
-                "estimated_bs_cost": calc_cost(prestige),
+        def calc_cost(i):
+            yearly_housing = self._yearly_housing.get(locations[i], (1100 + 350 + 100) * 12)
+            return (tuitions[i] + yearly_housing) * 2  # 2 years BS
+
+        def recommendation(i, default_tier, total_years):
+            return {
+                "university": universities[i],
+                "program": transfer_options[i].program,
+                "tier": rankings[i].get("tier", default_tier),
+                "ranking_score": scores[i],
+                "estimated_bs_cost": calc_cost(i),
                 "estimated_ms_cost": 0,
                 "estimated_phd_cost": 0,
-                "total_years": 4
+                "total_years": total_years
             }
+
+        return {
+            "cheapest": recommendation(cheapest, 2, 4),
+            "fastest": recommendation(fastest, 2, 3.5),
+            "prestige": recommendation(prestige, 1, 4)
         }
 
     def _synthesize_roadmap(
@@ -431,7 +700,8 @@ Return ONLY the JSON, no additional text."""
         pathway_result,
         cost_result,
         salary_result,
-        quiz_data: Dict[str, Any],
+        goals: List[str],
+        rankings: Dict[str, Dict[str, Any]],
         optimal_paths: Dict[str, Any] = None
     ) -> Dict[str, Any]:
         """
@@ -443,9 +713,6 @@ Return ONLY the JSON, no additional text."""
         - Edges (connections/prerequisites)
         - Citations (source URLs)
         """
-        # Extract user goals
-        goals = quiz_data.get('goals', [])
-
         # Build paths using Gemini's optimal selections
         cheapest_path = self._build_path(
             "cheapest",
@@ -482,6 +749,7 @@ Return ONLY the JSON, no additional text."""
             pathway_result,
             profile,
             goals,
+            rankings,
             paths={
                 "cheapest": cheapest_path,
                 "fastest": fastest_path,
@@ -528,7 +796,7 @@ Return ONLY the JSON, no additional text."""
         roi_years = total_investment / (net_salary - 35000)
         return round(roi_years, 1)
 
-    def _build_path(self, path_id: str, name: str, cost_data: Dict, pathway_result, median_salary: float, goals: List[str], optimal_path: Dict[str, Any] = None) -> Dict:
+    def _build_path(self, path_id: str, name: str, cost_data: PathBreakdown, pathway_result, median_salary: float, goals: List[str], optimal_path: Dict[str, Any] = None) -> Dict:
         """Build a single path with steps including internships/research and grad school"""
         steps = []
         step_id = 0
@@ -540,18 +808,19 @@ Return ONLY the JSON, no additional text."""
         if optimal_path:
             selected_university = optimal_path.get("university")
             selected_program = optimal_path.get("program")
-            print(f"[Orchestrator] Building {path_id} path with Gemini selection: {selected_university}")
+            logger.info("[Orchestrator] Building %s path with Gemini selection: %s", path_id, selected_university)
 
         # Add MDC program (if applicable) - cost is typically $6800 for 2 years in-state
         if pathway_result.mdc_programs:
             mdc_program = pathway_result.mdc_programs[0]
             # MDC cost: $3400/year * 2 years = $6800
-            mdc_cost = cost_data.get("breakdown", {}).get("mdc", 6800)
+            mdc_cost = cost_data.breakdown.get("mdc", 6800)
             steps.append({
                 "id": f"step-{step_id}",
                 "type": "program",
                 "institution": "Miami Dade College",
                 "duration": "2 years",
+                "duration_years": 2.0,
                 "cost": mdc_cost,
                 "prerequisites": [],
                 "description": f"{mdc_program.name} ({mdc_program.code if mdc_program.code else 'AA'})",
@@ -571,6 +840,7 @@ Return ONLY the JSON, no additional text."""
                     "type": "internship",
                     "institution": intern.get("name", "Industry Partner"),
                     "duration": "Summer (10-12 weeks)",
+                    "duration_years": 0.0,  # Summer, overlaps the degree
                     "cost": 0,  # Internships are paid
                     "prerequisites": [f"step-{step_id-1}"] if step_id > 0 else [],
                     "description": f"Internship: {intern.get('name', 'Industry Partner')}",
@@ -586,6 +856,7 @@ Return ONLY the JSON, no additional text."""
                     "type": "research",
                     "institution": "Research University",
                     "duration": "10 weeks (Summer REU)",
+                    "duration_years": 0.0,  # Summer, overlaps the degree
                     "cost": 0,  # REUs provide stipends
                     "prerequisites": [f"step-{step_id-1}"] if step_id > 0 else [],
                     "description": f"Research: {research.get('name', 'Undergraduate Research')}",
@@ -617,15 +888,16 @@ Return ONLY the JSON, no additional text."""
             # Calculate cost using optimal_path data if available, otherwise use cost_data
             if optimal_path and "estimated_bs_cost" in optimal_path:
                 university_cost = optimal_path["estimated_bs_cost"]
-                print(f"[Orchestrator] Using Gemini BS cost: ${university_cost:,.0f}")
+                logger.info("[Orchestrator] Using Gemini BS cost: $%.0f", university_cost)
             else:
-                university_cost = cost_data.get("breakdown", {}).get("university", 0) or cost_data.get("total", 0)
+                university_cost = cost_data.breakdown.get("university", 0) or cost_data.total
 
             steps.append({
                 "id": f"step-{step_id}",
                 "type": "program",
                 "institution": university_name,
                 "duration": "2 years",
+                "duration_years": 2.0,
                 "cost": university_cost,
                 "prerequisites": [f"step-{step_id-1}"] if step_id > 0 else [],
                 "description": program_name,
@@ -633,34 +905,40 @@ Return ONLY the JSON, no additional text."""
             })
             step_id += 1
 
-        # Add certifications
-        for cert in pathway_result.certifications:
-            if cert.required:
-                steps.append({
-                    "id": f"step-{step_id}",
-                    "type": "certification",
-                    "institution": "Professional Board",
-                    "duration": cert.timing,
-                    "cost": 200,  # Typical exam fee
-                    "prerequisites": [f"step-{step_id-1}"],
-                    "description": cert.name
-                })
-                step_id += 1
-
-        # Add licenses
-        for license in pathway_result.licenses:
-            if license.required:
-                steps.append({
-                    "id": f"step-{step_id}",
-                    "type": "license",
-                    "institution": f"{license.state} Board",
-                    "duration": license.timing,
-                    "cost": 300,  # Typical license fee
-                    "prerequisites": [f"step-{step_id-1}"],
-                    "description": license.name,
-                    "url": license.url or ""
-                })
-                step_id += 1
+        # Add certifications (required only), each following the previous step
+        required_certs = [cert for cert in pathway_result.certifications if cert.required]
+        steps.extend(
+            {
+                "id": f"step-{step_id + i}",
+                "type": "certification",
+                "institution": "Professional Board",
+                "duration": cert.timing,
+                "duration_years": _parse_duration_years(cert.timing),
+                "cost": 200,  # Typical exam fee
+                "prerequisites": [f"step-{step_id + i - 1}"],
+                "description": cert.name
+            }
+            for i, cert in enumerate(required_certs)
+        )
+        step_id += len(required_certs)
+
+        # Add licenses (required only)
+        required_licenses = [license for license in pathway_result.licenses if license.required]
+        steps.extend(
+            {
+                "id": f"step-{step_id + i}",
+                "type": "license",
+                "institution": f"{license.state} Board",
+                "duration": license.timing,
+                "duration_years": _parse_duration_years(license.timing),
+                "cost": 300,  # Typical license fee
+                "prerequisites": [f"step-{step_id + i - 1}"],
+                "description": license.name,
+                "url": license.url or ""
+            }
+            for i, license in enumerate(required_licenses)
+        )
+        step_id += len(required_licenses)
 
         # Add Masters program if user selected it
         if "masters" in goals and university_name:
@@ -668,7 +946,7 @@ Return ONLY the JSON, no additional text."""
             # Use Gemini's MS cost if available, otherwise calculate
             if optimal_path and "estimated_ms_cost" in optimal_path and optimal_path["estimated_ms_cost"] > 0:
                 ms_cost = optimal_path["estimated_ms_cost"]
-                print(f"[Orchestrator] Using Gemini MS cost: ${ms_cost:,.0f}")
+                logger.info("[Orchestrator] Using Gemini MS cost: $%.0f", ms_cost)
             else:
                 ms_cost = self._calculate_graduate_cost(university_name, "masters", 2)
 
@@ -677,6 +955,7 @@ Return ONLY the JSON, no additional text."""
                 "type": "masters",
                 "institution": university_name,
                 "duration": "2 years",
+                "duration_years": 2.0,
                 "cost": ms_cost,
                 "prerequisites": [f"step-{step_id-1}"] if step_id > 0 else [],
                 "description": f"MS in {degree_name}",
@@ -690,7 +969,7 @@ Return ONLY the JSON, no additional text."""
             # Use Gemini's PhD cost if available, otherwise calculate
             if optimal_path and "estimated_phd_cost" in optimal_path and optimal_path["estimated_phd_cost"] > 0:
                 phd_cost = optimal_path["estimated_phd_cost"]
-                print(f"[Orchestrator] Using Gemini PhD cost: ${phd_cost:,.0f}")
+                logger.info("[Orchestrator] Using Gemini PhD cost: $%.0f", phd_cost)
             else:
                 phd_cost = self._calculate_graduate_cost(university_name, "phd", 5)  # Average 5 years
 
@@ -699,6 +978,7 @@ Return ONLY the JSON, no additional text."""
                 "type": "phd",
                 "institution": university_name,
                 "duration": "4-6 years",
+                "duration_years": 4.0,  # Lower bound of the range
                 "cost": phd_cost,
                 "prerequisites": [f"step-{step_id-1}"] if step_id > 0 else [],
                 "description": f"PhD in {degree_name} - Research & Dissertation",
@@ -711,20 +991,13 @@ Return ONLY the JSON, no additional text."""
         final_total = calculated_total
 
         # Calculate total duration
-        total_years = 0
-        for step in steps:
-            duration_str = step.get("duration", "0 years")
-            if "year" in duration_str:
-                try:
-                    years = float(duration_str.split()[0].split("-")[0])
-                    total_years += years
-                except:
-                    pass
+        total_years = sum(step["duration_years"] for step in steps)
 
         # Calculate ROI using actual cost and salary
         calculated_roi = self._calculate_roi(final_total, median_salary, total_years)
 
-        print(f"[Orchestrator] path={path_id} total_cost=${final_total:,.0f} total_years={total_years:.1f} roi={calculated_roi:.1f} salary=${median_salary:,.0f} (sum of {len(steps)} steps)")
+        logger.info("[Orchestrator] path=%s total_cost=$%.0f total_years=%.1f roi=%.1f salary=$%.0f (sum of %d steps)",
+                    path_id, final_total, total_years, calculated_roi, median_salary, len(steps))
 
         return {
             "id": path_id,
@@ -735,7 +1008,7 @@ Return ONLY the JSON, no additional text."""
             "roi": calculated_roi
         }
 
-    def _build_graph(self, pathway_result, profile, goals: List[str], paths: Dict[str, Any] = None) -> tuple:
+    def _build_graph(self, pathway_result, profile, goals: List[str], rankings: Dict[str, Dict[str, Any]], paths: Dict[str, Any] = None) -> tuple:
         """Build nodes and edges for React Flow visualization with rankings and enhanced types"""
         nodes = []
         edges = []
@@ -780,7 +1053,7 @@ Return ONLY the JSON, no additional text."""
         # University nodes with ranking data and path tags
         last_university_node = None
         for i, transfer in enumerate(pathway_result.transfer_options[:3]):
-            ranking = self._get_university_ranking(transfer.university)
+            ranking = rankings[transfer.university]
             path_type = get_path_type(transfer.university)
 
             nodes.append({
@@ -805,7 +1078,7 @@ Return ONLY the JSON, no additional text."""
                     "id": f"edge-{len(edges)}",
                     "source": prev_node,
                     "target": f"node-{node_id}",
-                    "label": transfer.articulation if hasattr(transfer, 'articulation') else "Transfer"
+                    "label": getattr(transfer, 'articulation', "Transfer")
                 })
                 last_university_node = f"node-{node_id}"
 
@@ -813,195 +1086,171 @@ Return ONLY the JSON, no additional text."""
 
         y_pos += 150
 
-        # Certification/License nodes
-        for cert in pathway_result.certifications:
-            if cert.required:
-                nodes.append({
-                    "id": f"node-{node_id}",
-                    "type": "cert",
-                    "data": {
-                        "label": cert.name,
-                        "cost": 200,
-                        "duration": cert.timing,
-                        "url": cert.url or ""
-                    },
-                    "position": {"x": 250, "y": y_pos}
-                })
-                node_id += 1
-                y_pos += 100
-
-        for license in pathway_result.licenses:
-            if license.required:
-                nodes.append({
-                    "id": f"node-{node_id}",
-                    "type": "license",
-                    "data": {
-                        "label": f"{license.name} ({license.state})",
-                        "cost": 300,
-                        "duration": license.timing,
-                        "url": license.url or ""
-                    },
-                    "position": {"x": 250, "y": y_pos}
-                })
-                license_node = f"node-{node_id}"
-                node_id += 1
-                y_pos += 100
-
-        # Add Masters node if in goals
-        masters_node = None
-        if "masters" in goals and pathway_result.transfer_options:
-            university = pathway_result.transfer_options[0].university
-            career = profile.career if hasattr(profile, 'career') else "Engineering"
-            degree_name = self._get_degree_name(career)
-            ms_cost = self._calculate_graduate_cost(university, "masters", 2)
-
-            nodes.append({
-                "id": f"node-{node_id}",
-                "type": "masters",
+        # Certification/License nodes (required only), stacked 100px apart
+        required_certs = [cert for cert in pathway_result.certifications if cert.required]
+        nodes.extend(
+            {
+                "id": f"node-{node_id + i}",
+                "type": "cert",
                 "data": {
-                    "label": f"MS {degree_name}",
-                    "institution": university,
-                    "cost": ms_cost,
-                    "duration": "2 years",
-                    "url": "",
-                    "degree": "MS"
+                    "label": cert.name,
+                    "cost": 200,
+                    "duration": cert.timing,
+                    "url": cert.url or ""
                 },
-                "position": {"x": 250, "y": y_pos}
-            })
-
-            # Edge from BS to MS (use last_university_node or fallback)
-            if last_university_node:
-                edges.append({
-                    "id": f"edge-{len(edges)}",
-                    "source": last_university_node,
-                    "target": f"node-{node_id}",
-                    "label": "Graduate School"
-                })
-
-            masters_node = f"node-{node_id}"
-            node_id += 1
-            y_pos += 150
+                "position": {"x": 250, "y": y_pos + 100 * i}
+            }
+            for i, cert in enumerate(required_certs)
+        )
+        node_id += len(required_certs)
+        y_pos += 100 * len(required_certs)
+
+        required_licenses = [license for license in pathway_result.licenses if license.required]
+        nodes.extend(
+            {
+                "id": f"node-{node_id + i}",
+                "type": "license",
+                "data": {
+                    "label": f"{name} ({state})",
+                    "cost": 300,
+                    "duration": timing,
+                    "url": url or ""
+                },
+                "position": {"x": 250, "y": y_pos + 100 * i}
+            }
+            for i, (name, state, timing, url) in enumerate(map(_LICENSE_NODE_FIELDS, required_licenses))
+        )
+        node_id += len(required_licenses)
+        y_pos += 100 * len(required_licenses)
 
-        # Add PhD node if in goals
-        if "phd" in goals and pathway_result.transfer_options:
+        # Graduate school nodes (MS, then PhD) at the first transfer university
+        # Each entry: (node type, label, cost, duration, degree, label of the edge leading into it)
+        grad_programs = []
+        if pathway_result.transfer_options:
             university = pathway_result.transfer_options[0].university
-            career = profile.career if hasattr(profile, 'career') else "Engineering"
+            career = getattr(profile, 'career', "Engineering")
             degree_name = self._get_degree_name(career)
-            phd_cost = self._calculate_graduate_cost(university, "phd", 5)
-
-            nodes.append({
-                "id": f"node-{node_id}",
-                "type": "phd",
+            if "masters" in goals:
+                ms_cost = self._calculate_graduate_cost(university, "masters", 2)
+                grad_programs.append(("masters", f"MS {degree_name}", ms_cost, "2 years", "MS", "Graduate School"))
+            if "phd" in goals:
+                phd_cost = self._calculate_graduate_cost(university, "phd", 5)  # Average 5 years
+                grad_programs.append(("phd", f"PhD in {degree_name}", phd_cost, "4-6 years", "PhD", "Doctoral Research"))
+
+        nodes.extend(
+            {
+                "id": f"node-{node_id + i}",
+                "type": node_type,
                 "data": {
-                    "label": f"PhD in {degree_name}",
+                    "label": label,
                     "institution": university,
-                    "cost": phd_cost,
-                    "duration": "4-6 years",
+                    "cost": cost,
+                    "duration": duration,
                     "url": "",
-                    "degree": "PhD"
+                    "degree": degree
                 },
-                "position": {"x": 250, "y": y_pos}
-            })
-
-            # Edge from MS to PhD (or BS if no MS)
-            source_node = masters_node if masters_node else last_university_node
-            if source_node:
-                edges.append({
-                    "id": f"edge-{len(edges)}",
-                    "source": source_node,
-                    "target": f"node-{node_id}",
-                    "label": "Doctoral Research"
-                })
+                "position": {"x": 250, "y": y_pos + 150 * i}
+            }
+            for i, (node_type, label, cost, duration, degree, _) in enumerate(grad_programs)
+        )
 
-            node_id += 1
-            y_pos += 150
+        # BS -> MS -> PhD chain (PhD hangs off BS when there is no MS); skip edges without a source
+        sources = [last_university_node] + [f"node-{node_id + i}" for i in range(len(grad_programs) - 1)]
+        grad_edges = [
+            (source, f"node-{node_id + i}", program[5])
+            for i, (source, program) in enumerate(zip(sources, grad_programs))
+            if source
+        ]
+        first_edge = len(edges)
+        edges.extend(
+            {
+                "id": f"edge-{first_edge + i}",
+                "source": source,
+                "target": target,
+                "label": label
+            }
+            for i, (source, target, label) in enumerate(grad_edges)
+        )
+        node_id += len(grad_programs)
+        y_pos += 150 * len(grad_programs)
 
         return nodes, edges
 
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _classify_career(career: str) -> Tuple[str, str]:
+        """
+        Classify a career once into (degree name, seed data key) (memoized).
+
+        The two rule tables keep separate priorities (e.g. "computer" names a
+        degree but not a seed key), so both are evaluated here and shared.
+        """
+        degree_match = _DEGREE_NAME_RE.match(career)
+        key_match = _CAREER_KEY_RE.match(career)
+        return (
+            _DEGREE_NAMES[degree_match.lastgroup] if degree_match else career,  # Default to career name
+            _CAREER_KEYS[key_match.lastgroup] if key_match else career,
+        )
+
     def _get_degree_name(self, career: str) -> str:
         """Convert career name to proper degree name"""
-        career_lower = career.lower()
-        if "software" in career_lower or "developer" in career_lower or "computer" in career_lower or "programmer" in career_lower:
-            return "Computer Science"
-        elif "mechanical" in career_lower:
-            return "Mechanical Engineering"
-        elif "electrical" in career_lower or "electronics" in career_lower:
-            return "Electrical Engineering"
-        elif "civil" in career_lower:
-            return "Civil Engineering"
-        elif "business" in career_lower or "finance" in career_lower or "account" in career_lower:
-            return "Business Administration"
-        elif "nurs" in career_lower:
-            return "Nursing"
-        elif "data" in career_lower and "scien" in career_lower:
-            return "Data Science"
-        else:
-            return career  # Default to career name
+        return self._classify_career(career)[0]
 
     def _match_career_key(self, career: str) -> str:
         """Match career name to seed data key"""
-        career_lower = career.lower()
-        if "mechanical" in career_lower or "mae" in career_lower:
-            return "Mechanical Engineer"
-        elif "electrical" in career_lower or "eee" in career_lower:
-            return "Electrical Engineer"
-        elif "civil" in career_lower:
-            return "Civil Engineer"
-        elif "software" in career_lower or "computer science" in career_lower:
-            return "Software Developer"
-        elif "nurs" in career_lower:
-            return "Registered Nurse"
-        elif "architect" in career_lower:
-            return "Architect"
-        elif "account" in career_lower:
-            return "Accountant"
-        elif "data" in career_lower:
-            return "Data Scientist"
-        else:
-            return career
-
-    def _get_university_ranking(self, university: str) -> Dict[str, Any]:
-        """Get ranking data for a university"""
-        # Try exact match first
-        if university in self.ranking_data:
-            return self.ranking_data[university]
+        return self._classify_career(career)[1]
+
+    def _get_university_ranking(self, university: str) -> Mapping[str, Any]:
+        """Get ranking data for a university (memoized; callers must not mutate the result)"""
+        ranking = self._ranking_cache.get(university)
+        if ranking is not None:
+            return ranking
 
-        # Try abbreviated match
-        for abbrev in ["UF", "UM", "FSU", "UCF", "FAU", "FIU", "USF"]:
-            if abbrev in university:
-                return self.ranking_data.get(abbrev, {"tier": 3, "ranking_label": "Regional University"})
+        # Try exact match first
+        ranking = self.ranking_data.get(university)
+        if ranking is None:
+            # Try abbreviated match (single regex scan, same priority as the abbreviation order)
+            match = _UNIVERSITY_ABBREV_RE.match(university)
+            ranking = self.ranking_data.get(match.lastgroup, _DEFAULT_RANKING) if match else _DEFAULT_RANKING
 
-        return {"tier": 3, "ranking_label": "Regional University"}
+        self._ranking_cache[university] = ranking
+        return ranking
 
     def _calculate_graduate_cost(self, university: str, degree_type: str, years: float) -> float:
-        """Calculate cost for Masters or PhD including tuition, housing, food, transport"""
+        """Calculate cost for Masters or PhD including tuition, housing, food, transport (memoized)"""
+        key = (university, degree_type, years)
+        cost = self._grad_cost_cache.get(key)
+        if cost is None:
+            cost = self._grad_cost_cache[key] = self._compute_graduate_cost(university, degree_type, years)
+        return cost
+
+    def _compute_graduate_cost(self, university: str, degree_type: str, years: float) -> float:
+        """Uncached body of _calculate_graduate_cost"""
         # Get university ranking data for tuition
         ranking = self._get_university_ranking(university)
         location = ranking.get("location", "Miami, FL")
 
-        # Determine if in-state or out-of-state
-        is_in_state = "FL" in location
+        # Common case: 5-year PhD in a city with seeded housing costs
+        if degree_type == "phd" and years == 5 and location in self._phd_cost_5yr:
+            return self._phd_cost_5yr[location]
+
+        # Determine if in-state or out-of-state (unknown schools default to Miami, like location)
+        is_in_state = ranking.get("is_in_state", True)
         undergrad_tuition = ranking.get("tuition_in_state" if is_in_state else "tuition_out_of_state", 10000)
 
         # Graduate tuition (typically 20% higher than undergrad)
         grad_tuition_per_year = undergrad_tuition * 1.2
 
-        # Get housing costs
-        housing = self.housing_data.get(location, {})
-        yearly_rent = housing.get("avg_rent_shared", 1100) * 12
-        yearly_food = housing.get("avg_food", 350) * 12
-        yearly_transport = housing.get("avg_transport", 110) * 12
-        yearly_living = yearly_rent + yearly_food + yearly_transport
+        # Get housing costs (rent + food + transport, precomputed per city)
+        yearly_living = self._yearly_housing.get(location, (1100 + 350 + 110) * 12)
 
         # PhD is typically funded - tuition waived, stipend covers ~70% of living
         # Student pays only ~30% of living expenses out of pocket
         if degree_type == "phd":
-            out_of_pocket_yearly = yearly_living * 0.3
-            books_fees = 800 + 500  # Research materials + conferences
-            total_cost = (out_of_pocket_yearly + books_fees) * years
+            total_cost = _phd_cost(yearly_living, years)
         else:  # Masters
             books_fees = 1000  # Textbooks and fees
             total_cost = (grad_tuition_per_year + yearly_living + books_fees) * years
 
-        print(f"[Orchestrator] {degree_type.upper()} cost for {university}: ${total_cost:,.0f} ({years} years)")
+        logger.debug("[Orchestrator] %s cost for %s: $%.0f (%s years)", degree_type.upper(), university, total_cost, years)
         return round(total_cost, 2)
@@ -1,6 +1,7 @@
 import os
 import google.generativeai as genai
 from dotenv import load_dotenv
+from _gen_models import list_generate_content_models
 
 # Load environment variables
 load_dotenv()
@@ -15,9 +16,8 @@ print("=" * 60)
 
 # Test 1: List models
 print("\n1. Available models with generateContent:")
-for m in genai.list_models():
-    if 'generateContent' in m.supported_generation_methods:
-        print(f"   ✅ {m.name}")
+for m in list_generate_content_models():
+    print(f"   ✅ {m['name']}")
 
 # Test 2: Try generating with different model names
 test_models = [
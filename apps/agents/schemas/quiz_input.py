@@ -1,24 +1,60 @@
 """
 Pydantic schemas for quiz input validation
 """
-from typing import List, Literal
-from pydantic import BaseModel, Field, field_validator
+from enum import StrEnum
+from typing import List
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+
+class Education(StrEnum):
+    """Current education level"""
+    HS = "hs"
+    SOME_COLLEGE = "some_college"
+    AA = "aa"
+    BA = "ba"
+
+
+class Budget(StrEnum):
+    """Total education budget tier"""
+    LOW = "low"
+    MEDIUM = "medium"
+    HIGH = "high"
+
+
+class Timeline(StrEnum):
+    """Timeline preference"""
+    FAST = "fast"
+    NORMAL = "normal"
+    FLEXIBLE = "flexible"
+
+
+class LocationPreference(StrEnum):
+    """Where the student is willing to study"""
+    MIAMI = "miami"
+    FLORIDA = "florida"
+    ANYWHERE = "anywhere"
+
+
+class WorkSchedule(StrEnum):
+    """Student workload"""
+    FULL_TIME_STUDENT = "full-time-student"
+    PART_TIME_STUDENT = "part-time-student"
 
 
 class QuizInput(BaseModel):
     """User quiz input data"""
     career: str = Field(..., description="Target career (e.g., 'Mechanical Engineer')")
-    current_education: Literal["hs", "some_college", "aa", "ba"] = Field(
+    current_education: Education = Field(
         ..., description="Current education level"
     )
     gpa: float = Field(..., ge=0.0, le=4.0, description="Current GPA")
-    budget: Literal["low", "medium", "high"] = Field(
+    budget: Budget = Field(
         ..., description="Total education budget (<30k, 30-80k, >80k)"
     )
-    timeline: Literal["fast", "normal", "flexible"] = Field(
+    timeline: Timeline = Field(
         ..., description="Timeline preference (2yr, 4yr, 6yr+)"
     )
-    location: Literal["miami", "florida", "anywhere"] = Field(
+    location: LocationPreference = Field(
         ..., description="Location preference"
     )
     goals: List[str] = Field(
@@ -29,8 +65,8 @@ class QuizInput(BaseModel):
         default=False, description="Has existing college credits"
     )
     veteran_status: bool = Field(default=False, description="Veteran or active military")
-    work_schedule: Literal["full-time-student", "part-time-student"] = Field(
-        default="full-time-student", description="Work schedule"
+    work_schedule: WorkSchedule = Field(
+        default=WorkSchedule.FULL_TIME_STUDENT.value, description="Work schedule"
     )
 
     @field_validator("career")
@@ -41,21 +77,21 @@ class QuizInput(BaseModel):
             raise ValueError("Career cannot be empty")
         return v.strip()
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "career": "Mechanical Engineer",
-                "current_education": "hs",
-                "gpa": 3.5,
-                "budget": "medium",
-                "timeline": "normal",
-                "location": "miami",
-                "goals": ["internship", "PE_license"],
-                "has_transfer_credits": False,
-                "veteran_status": False,
-                "work_schedule": "full-time-student"
-            }
+    # Dump plain strings so downstream dicts/prompts are unchanged
+    model_config = ConfigDict(use_enum_values=True, json_schema_extra={
+        "example": {
+            "career": "Mechanical Engineer",
+            "current_education": "hs",
+            "gpa": 3.5,
+            "budget": "medium",
+            "timeline": "normal",
+            "location": "miami",
+            "goals": ["internship", "PE_license"],
+            "has_transfer_credits": False,
+            "veteran_status": False,
+            "work_schedule": "full-time-student"
         }
+    })
 
 
 class ProfileData(BaseModel):
@@ -1,16 +1,19 @@
 """
 Pydantic schemas for roadmap output
 """
-from typing import List, Dict, Optional, Literal
-from pydantic import BaseModel, Field
+from typing import Any, List, Dict, Optional, Literal
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Step(BaseModel):
     """A single step in an educational/career path"""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     type: Literal["program", "course", "certification", "license", "job"]
     institution: str
     duration: str = Field(..., description="Duration (e.g., '2 years', '6 months')")
+    duration_years: float = Field(0.0, description="Duration in years, summed for path totals")
     cost: float = Field(..., description="Cost in USD")
     prerequisites: List[str] = Field(default_factory=list)
     description: str
@@ -26,11 +29,24 @@ class Path(BaseModel):
     roi: float = Field(..., description="Years to break even")
 
 
+class NodeData(BaseModel):
+    """Display data for a React Flow node"""
+    label: str
+    cost: float
+    duration: str
+    url: str = ""
+    institution: Optional[str] = None
+    degree: Optional[str] = None
+    tier: Optional[str] = None
+    ranking_label: Optional[str] = None
+    path_type: Optional[str] = Field(None, description="cheapest/fastest/prestige, None if shared")
+
+
 class Node(BaseModel):
     """React Flow node"""
     id: str
     type: Literal["mdc", "university", "cert", "license", "outcome", "masters", "phd", "internship", "research"]
-    data: Dict = Field(
+    data: NodeData = Field(
         ...,
         description="Node data (label, cost, duration, url)"
     )
@@ -47,6 +63,8 @@ class Edge(BaseModel):
 
 class Citation(BaseModel):
     """Source citation"""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     title: str
     url: str
@@ -55,6 +73,8 @@ class Citation(BaseModel):
 
 class MDCProgram(BaseModel):
     """MDC academic program"""
+    model_config = ConfigDict(frozen=True)
+
     code: str = Field(..., description="Program code (e.g., AS.EGR)")
     name: str
     credits: int
@@ -63,6 +83,8 @@ class MDCProgram(BaseModel):
 
 class TransferOption(BaseModel):
     """University transfer option"""
+    model_config = ConfigDict(frozen=True)
+
     university: str
     program: str
     articulation: str = Field(..., description="Agreement type (e.g., '2+2')")
@@ -72,6 +94,8 @@ class TransferOption(BaseModel):
 
 class Certification(BaseModel):
     """Professional certification"""
+    model_config = ConfigDict(frozen=True)
+
     name: str
     required: bool
     timing: str = Field(..., description="When to obtain (e.g., 'Before graduation')")
@@ -80,6 +104,8 @@ class Certification(BaseModel):
 
 class License(BaseModel):
     """Professional license"""
+    model_config = ConfigDict(frozen=True)
+
     name: str
     required: bool
     timing: str
@@ -106,11 +132,37 @@ class CostBreakdown(BaseModel):
     total: float
 
 
+class PathBreakdown(BaseModel):
+    """Total and itemized cost for one path"""
+    total: float
+    breakdown: Dict[str, Any] = Field(default_factory=dict)
+
+
 class CostResult(BaseModel):
     """Result from CostEstimatorAgent"""
-    cheapest_path: Dict = Field(..., description="Cheapest path cost breakdown")
-    fastest_path: Dict = Field(..., description="Fastest path cost breakdown")
-    prestige_path: Dict = Field(..., description="Prestige path cost breakdown")
+    cheapest_path: PathBreakdown = Field(..., description="Cheapest path cost breakdown")
+    fastest_path: PathBreakdown = Field(..., description="Fastest path cost breakdown")
+    prestige_path: PathBreakdown = Field(..., description="Prestige path cost breakdown")
+
+
+class PathRecommendation(BaseModel):
+    """Gemini's university pick for one path (no field defaults: used as response_schema)"""
+    university: str
+    program: str
+    tier: int
+    ranking_score: int
+    estimated_bs_cost: float
+    estimated_ms_cost: float
+    estimated_phd_cost: float
+    total_years: float
+    reasoning: str
+
+
+class PathRecommendations(BaseModel):
+    """Structured Gemini output for cheapest/fastest/prestige path selection"""
+    cheapest: PathRecommendation
+    fastest: PathRecommendation
+    prestige: PathRecommendation
 
 
 class SalaryResult(BaseModel):
@@ -138,25 +190,24 @@ class Roadmap(BaseModel):
         description="Generated timestamp, confidence, etc."
     )
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "paths": {
-                    "cheapest": {
-                        "id": "cheapest",
-                        "name": "Most Affordable Path",
-                        "total_cost": 28000,
-                        "duration": "4 years",
-                        "steps": [],
-                        "roi": 6.2
-                    }
-                },
-                "nodes": [],
-                "edges": [],
-                "citations": [],
-                "metadata": {
-                    "generated_at": "2025-11-07T12:00:00Z",
-                    "confidence": 0.85
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "paths": {
+                "cheapest": {
+                    "id": "cheapest",
+                    "name": "Most Affordable Path",
+                    "total_cost": 28000,
+                    "duration": "4 years",
+                    "steps": [],
+                    "roi": 6.2
                 }
+            },
+            "nodes": [],
+            "edges": [],
+            "citations": [],
+            "metadata": {
+                "generated_at": "2025-11-07T12:00:00Z",
+                "confidence": 0.85
             }
         }
+    })
@@ -10,39 +10,41 @@ import os
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
+from _paths import ENV_PATH
 
 # Load environment variables from careerpilot/.env
-# Navigate from apps/agents/ to careerpilot/.env
-env_path = Path(__file__).parent.parent.parent / ".env"
-print(f"Loading .env from: {env_path}")
-print(f".env exists: {env_path.exists()}")
-load_dotenv(dotenv_path=env_path)
+print(f"Loading .env from: {ENV_PATH}")
+print(f".env exists: {ENV_PATH.exists()}")
+load_dotenv(dotenv_path=ENV_PATH)
 
 def test_env_loading():
     """Test environment variable loading and fallback handling"""
+    # Buffer the report and write it once at the end
+    lines: list[str] = []
+    out = lines.append
 
-    print("=" * 60)
-    print("CareerPilot AI - Environment Configuration Test")
-    print("=" * 60)
-    print()
+    out("=" * 60)
+    out("CareerPilot AI - Environment Configuration Test")
+    out("=" * 60)
+    out("")
 
     # Required variables
-    print("✓ REQUIRED VARIABLES:")
-    print("-" * 60)
+    out("✓ REQUIRED VARIABLES:")
+    out("-" * 60)
 
     gcp_project = os.getenv("GCP_PROJECT_ID")
     gcp_location = os.getenv("GCP_LOCATION")
     gcp_credentials = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
 
     if gcp_project and gcp_project != "your-gcp-project-id":
-        print(f"✅ GCP_PROJECT_ID: {gcp_project}")
+        out(f"✅ GCP_PROJECT_ID: {gcp_project}")
     else:
-        print("❌ GCP_PROJECT_ID: NOT SET (required for Vertex AI)")
+        out("❌ GCP_PROJECT_ID: NOT SET (required for Vertex AI)")
 
     if gcp_location:
-        print(f"✅ GCP_LOCATION: {gcp_location}")
+        out(f"✅ GCP_LOCATION: {gcp_location}")
     else:
-        print("❌ GCP_LOCATION: NOT SET (required for Vertex AI)")
+        out("❌ GCP_LOCATION: NOT SET (required for Vertex AI)")
 
     if gcp_credentials:
         credentials_path = Path(gcp_credentials)
@@ -54,89 +56,90 @@ def test_env_loading():
             exists = abs_path.exists()
 
         if exists:
-            print(f"✅ GOOGLE_APPLICATION_CREDENTIALS: {gcp_credentials} (file exists)")
+            out(f"✅ GOOGLE_APPLICATION_CREDENTIALS: {gcp_credentials} (file exists)")
         else:
-            print(f"⚠️  GOOGLE_APPLICATION_CREDENTIALS: {gcp_credentials} (file NOT FOUND)")
+            out(f"⚠️  GOOGLE_APPLICATION_CREDENTIALS: {gcp_credentials} (file NOT FOUND)")
     else:
-        print("❌ GOOGLE_APPLICATION_CREDENTIALS: NOT SET")
+        out("❌ GOOGLE_APPLICATION_CREDENTIALS: NOT SET")
 
-    print()
+    out("")
 
     # Optional variables with fallback
-    print("✓ OPTIONAL VARIABLES (fallback data available):")
-    print("-" * 60)
+    out("✓ OPTIONAL VARIABLES (fallback data available):")
+    out("-" * 60)
 
     scorecard_key = os.getenv("SCORECARD_API_KEY")
     if scorecard_key and scorecard_key != "your-scorecard-api-key":
-        print(f"✅ SCORECARD_API_KEY: {'*' * 10}{scorecard_key[-4:]} (API enabled)")
+        out(f"✅ SCORECARD_API_KEY: {'*' * 10}{scorecard_key[-4:]} (API enabled)")
     else:
-        print("⚠️  SCORECARD_API_KEY: NOT SET (will use fallback data)")
+        out("⚠️  SCORECARD_API_KEY: NOT SET (will use fallback data)")
 
     bls_key = os.getenv("BLS_API_KEY")
     if bls_key and bls_key != "your-bls-registration-key":
-        print(f"✅ BLS_API_KEY: {'*' * 10}{bls_key[-4:]} (API enabled)")
+        out(f"✅ BLS_API_KEY: {'*' * 10}{bls_key[-4:]} (API enabled)")
     else:
-        print("⚠️  BLS_API_KEY: NOT SET (will use fallback data)")
+        out("⚠️  BLS_API_KEY: NOT SET (will use fallback data)")
 
     search_key = os.getenv("GOOGLE_SEARCH_API_KEY")
     search_engine = os.getenv("GOOGLE_SEARCH_ENGINE_ID")
     if search_key and search_key != "your-google-search-api-key":
-        print(f"✅ GOOGLE_SEARCH_API_KEY: {'*' * 10}{search_key[-4:]} (API enabled)")
+        out(f"✅ GOOGLE_SEARCH_API_KEY: {'*' * 10}{search_key[-4:]} (API enabled)")
     else:
-        print("⚠️  GOOGLE_SEARCH_API_KEY: NOT SET (will use seed data)")
+        out("⚠️  GOOGLE_SEARCH_API_KEY: NOT SET (will use seed data)")
 
     if search_engine and search_engine != "your-custom-search-engine-id":
-        print(f"✅ GOOGLE_SEARCH_ENGINE_ID: {search_engine}")
+        out(f"✅ GOOGLE_SEARCH_ENGINE_ID: {search_engine}")
     else:
-        print("⚠️  GOOGLE_SEARCH_ENGINE_ID: NOT SET")
+        out("⚠️  GOOGLE_SEARCH_ENGINE_ID: NOT SET")
 
-    print()
-    print("=" * 60)
-    print()
+    out("")
+    out("=" * 60)
+    out("")
 
     # Test API fallback functions
-    print("✓ TESTING API FALLBACK FUNCTIONS:")
-    print("-" * 60)
+    out("✓ TESTING API FALLBACK FUNCTIONS:")
+    out("-" * 60)
 
     try:
         from tools.scorecard import get_college_costs
         fiu_costs = get_college_costs("Florida International University")
-        if fiu_costs.get("in_state_tuition", 0) > 0:
-            print(f"✅ College Scorecard API/Fallback: Working")
-            print(f"   → FIU In-State Tuition: ${fiu_costs['in_state_tuition']:,.0f}")
+        if fiu_costs.in_state_tuition > 0:
+            out(f"✅ College Scorecard API/Fallback: Working")
+            out(f"   → FIU In-State Tuition: ${fiu_costs.in_state_tuition:,.0f}")
         else:
-            print("❌ College Scorecard: Failed to retrieve data")
+            out("❌ College Scorecard: Failed to retrieve data")
     except Exception as e:
-        print(f"❌ College Scorecard: Error - {e}")
+        out(f"❌ College Scorecard: Error - {e}")
 
     try:
         from tools.bls import get_salary_for_career
         salary_data = get_salary_for_career("Software Developer")
         if salary_data and salary_data.get("mean_annual_wage"):
-            print(f"✅ BLS API/Fallback: Working")
-            print(f"   → Software Developer Median Salary: ${salary_data['mean_annual_wage']:,.0f}")
+            out(f"✅ BLS API/Fallback: Working")
+            out(f"   → Software Developer Median Salary: ${salary_data['mean_annual_wage']:,.0f}")
         else:
-            print("❌ BLS API: Failed to retrieve data")
+            out("❌ BLS API: Failed to retrieve data")
     except Exception as e:
-        print(f"❌ BLS API: Error - {e}")
+        out(f"❌ BLS API: Error - {e}")
 
-    print()
-    print("=" * 60)
-    print()
+    out("")
+    out("=" * 60)
+    out("")
 
     # Summary
     has_gcp = gcp_project and gcp_project != "your-gcp-project-id"
 
     if has_gcp:
-        print("✅ CONFIGURATION STATUS: Ready to run")
-        print("   Run: python main.py")
+        out("✅ CONFIGURATION STATUS: Ready to run")
+        out("   Run: python main.py")
     else:
-        print("❌ CONFIGURATION STATUS: Missing required GCP credentials")
-        print("   Please configure GCP_PROJECT_ID and GOOGLE_APPLICATION_CREDENTIALS")
-        print("   See README.md for setup instructions")
+        out("❌ CONFIGURATION STATUS: Missing required GCP credentials")
+        out("   Please configure GCP_PROJECT_ID and GOOGLE_APPLICATION_CREDENTIALS")
+        out("   See README.md for setup instructions")
 
-    print()
-    print("=" * 60)
+    out("")
+    out("=" * 60)
+    print("\n".join(lines))
 
 if __name__ == "__main__":
     test_env_loading()
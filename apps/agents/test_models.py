@@ -3,13 +3,13 @@
 Test script to list available Gemini models
 """
 import os
-from pathlib import Path
 from dotenv import load_dotenv
 import google.generativeai as genai
+from _gen_models import list_generate_content_models
+from _paths import ENV_PATH
 
 # Load .env
-env_path = Path(__file__).parent.parent.parent / ".env"
-load_dotenv(dotenv_path=env_path)
+load_dotenv(dotenv_path=ENV_PATH)
 
 # Configure API
 api_key = os.getenv("GOOGLE_SEARCH_API_KEY")
@@ -23,8 +23,7 @@ print("=" * 60)
 print("Available Gemini Models:")
 print("=" * 60)
 
-for model in genai.list_models():
-    if 'generateContent' in model.supported_generation_methods:
-        print(f"\n✅ {model.name}")
-        print(f"   Display Name: {model.display_name}")
-        print(f"   Supported: {', '.join(model.supported_generation_methods)}")
+for model in list_generate_content_models():
+    print(f"\n✅ {model['name']}")
+    print(f"   Display Name: {model['display_name']}")
+    print(f"   Supported: {', '.join(model['supported_generation_methods'])}")
@@ -2,6 +2,7 @@
 import google.generativeai as genai
 import os
 from dotenv import load_dotenv
+from _gen_models import list_generate_content_models
 
 # Load environment variables
 load_dotenv()
@@ -15,7 +16,6 @@ print("=" * 60)
 print("Available Gemini Models that support generateContent:")
 print("=" * 60)
 
-for model in genai.list_models():
-    if 'generateContent' in model.supported_generation_methods:
-        print(f"\n✅ Model: {model.name}")
-        print(f"   Display: {model.display_name}")
+for model in list_generate_content_models():
+    print(f"\n✅ Model: {model['name']}")
+    print(f"   Display: {model['display_name']}")
@@ -6,14 +6,22 @@ import pytest
 from agents.pathway_research import PathwayResearchAgent
 
 
+@pytest.fixture(autouse=True)
+def offline_search(monkeypatch):
+    """Stub the Google Custom Search call so tests never hit the network (agent uses seed/fallback data)"""
+    monkeypatch.setattr("agents.pathway_research.search_mdc_programs", lambda career: [])
+
+
+@pytest.fixture(scope="module")
+def agent():
+    """One agent shared by every test in this module (run() keeps no per-call state)"""
+    return PathwayResearchAgent()
+
+
 class TestEngineeringPathways:
     """Test engineering career pathways"""
 
-    def setup_method(self):
-        """Initialize agent before each test"""
-        self.agent = PathwayResearchAgent()
-
-    def test_mechanical_engineer_pathway(self):
+    def test_mechanical_engineer_pathway(self, agent):
         """
         Verify ME pathway includes:
         - MDC AS.EGR program
@@ -27,7 +35,7 @@ class TestEngineeringPathways:
             "constraints": {"location": "miami"}
         }
 
-        result = self.agent.run(profile)
+        result = agent.run(profile)
 
         # Check MDC program
         assert len(result.mdc_programs) > 0, "Should have at least one MDC program"
@@ -53,7 +61,7 @@ class TestEngineeringPathways:
         assert len(pe_licenses) > 0, "Mechanical Engineer requires PE License"
         assert pe_licenses[0].state == "Florida"
 
-    def test_electrical_engineer_pathway(self):
+    def test_electrical_engineer_pathway(self, agent):
         """
         Verify EE pathway includes:
         - Same MDC engineering program (AS.EGR)
@@ -66,7 +74,7 @@ class TestEngineeringPathways:
             "constraints": {"location": "florida"}
         }
 
-        result = self.agent.run(profile)
+        result = agent.run(profile)
 
         # EE uses same MDC engineering AS
         assert len(result.mdc_programs) > 0
@@ -86,14 +94,14 @@ class TestEngineeringPathways:
         assert any("FE" in c.name for c in result.certifications), "EE requires FE Exam"
         assert any("PE" in l.name for l in result.licenses), "EE requires PE License"
 
-    def test_civil_engineer_pathway(self):
+    def test_civil_engineer_pathway(self, agent):
         """Verify Civil Engineer has same requirements as ME/EE"""
         profile = {
             "career": "Civil Engineer",
             "category": "STEM-Engineering"
         }
 
-        result = self.agent.run(profile)
+        result = agent.run(profile)
 
         # Same pattern as ME/EE
         assert len(result.mdc_programs) > 0
@@ -106,10 +114,7 @@ class TestEngineeringPathways:
 class TestSoftwarePathways:
     """Test software/technology career pathways"""
 
-    def setup_method(self):
-        self.agent = PathwayResearchAgent()
-
-    def test_software_developer_pathway(self):
+    def test_software_developer_pathway(self, agent):
         """
         Verify Software Developer pathway:
         - MDC Computer Science AS
@@ -123,7 +128,7 @@ class TestSoftwarePathways:
             "constraints": {"location": "miami"}
         }
 
-        result = self.agent.run(profile)
+        result = agent.run(profile)
 
         # Check MDC CS program
         assert len(result.mdc_programs) > 0
@@ -147,14 +152,14 @@ class TestSoftwarePathways:
         optional_certs = [c for c in result.certifications if not c.required]
         # No assertion - optional is fine
 
-    def test_software_engineer_same_as_developer(self):
+    def test_software_engineer_same_as_developer(self, agent):
         """Verify 'Software Engineer' treated same as 'Software Developer'"""
         profile = {
             "career": "Software Engineer",
             "category": "STEM-Technology"
         }
 
-        result = self.agent.run(profile)
+        result = agent.run(profile)
 
         # Should have CS program
         assert len(result.mdc_programs) > 0
@@ -166,10 +171,7 @@ class TestSoftwarePathways:
 class TestHealthcarePathways:
     """Test healthcare career pathways"""
 
-    def setup_method(self):
-        self.agent = PathwayResearchAgent()
-
-    def test_registered_nurse_pathway(self):
+    def test_registered_nurse_pathway(self, agent):
         """
         Verify RN pathway:
         - MDC Nursing ADN (AS.NUR)
@@ -182,7 +184,7 @@ class TestHealthcarePathways:
             "constraints": {"location": "miami"}
         }
 
-        result = self.agent.run(profile)
+        result = agent.run(profile)
 
         # Check MDC nursing program
         assert len(result.mdc_programs) > 0
@@ -203,10 +205,7 @@ class TestHealthcarePathways:
 class TestArchitecturePathways:
     """Test architecture career pathways"""
 
-    def setup_method(self):
-        self.agent = PathwayResearchAgent()
-
-    def test_architect_pathway(self):
+    def test_architect_pathway(self, agent):
         """
         Verify Architect pathway:
         - NAAB-accredited programs
@@ -218,7 +217,7 @@ class TestArchitecturePathways:
             "category": "STEM-Architecture"
         }
 
-        result = self.agent.run(profile)
+        result = agent.run(profile)
 
         # Architecture requires specific licensing
         assert len(result.licenses) > 0, "Architect requires professional license"
@@ -231,11 +230,10 @@ class TestArchitecturePathways:
 
 # Performance test
 @pytest.mark.slow
-def test_pathway_research_completes_quickly():
+def test_pathway_research_completes_quickly(agent):
     """Verify pathway research completes in reasonable time"""
     import time
 
-    agent = PathwayResearchAgent()
     profile = {
         "career": "Mechanical Engineer",
         "category": "STEM-Engineering"
@@ -245,7 +243,7 @@ def test_pathway_research_completes_quickly():
     result = agent.run(profile)
     duration = time.time() - start
 
-    assert duration < 15.0, f"Pathway research took too long: {duration:.2f}s"
+    assert duration < 0.5, f"Pathway research took too long: {duration:.2f}s"
     assert len(result.mdc_programs) > 0
 
 
@@ -0,0 +1,132 @@
+"""
+Tests for the BLS tool: career code matching, ROI math and the circuit breaker
+"""
+import itertools
+import pytest
+import orjson
+import requests
+from tools import bls
+from tools.cache import JsonDiskCache
+
+
+class TestCareerCodeMatching:
+    """get_bls_code_for_career keeps the table-order, first-match semantics"""
+
+    @pytest.mark.parametrize("career, code", [
+        ("Software Engineer", "15-1252"),        # Direct match
+        ("  nurse ", "29-1141"),                 # Normalized direct match
+        ("Senior Software Engineer", "15-1252"),  # Key inside the career
+        ("engineer", "17-2141"),                 # Career inside several keys: first key wins
+        ("soft", "15-1252"),                     # Career inside a key
+        ("registered nurse and paralegal", "29-1141"),  # Two keys: earlier table entry wins
+        ("lawyer or teacher", "25-2021"),        # Two keys: table order, not position in the text
+        ("Marine Biologist", None),
+    ])
+    def test_match_order(self, career, code):
+        assert bls.get_bls_code_for_career(career) == code
+
+
+class TestCalculateRoiVec:
+    """calculate_roi_vec agrees with the scalar calculate_roi"""
+
+    def test_matches_scalar_on_grid(self):
+        salaries = [0, 45000, 95000]
+        costs = [0, 30000, 120000]
+        years = [2.0, 4.0]
+        tax_rates = [0.0, 0.25, 1.0]
+
+        grid = list(itertools.product(salaries, costs, years, tax_rates))
+        vectorized = bls.calculate_roi_vec(*zip(*grid))
+
+        assert vectorized.shape == (len(grid),)
+        for scenario, roi in zip(grid, vectorized):
+            assert roi == pytest.approx(bls.calculate_roi(*scenario))
+
+    def test_broadcasts_scalar_inputs(self):
+        result = bls.calculate_roi_vec([95000, 60000], 30000)
+
+        assert list(result) == pytest.approx([bls.calculate_roi(95000, 30000), bls.calculate_roi(60000, 30000)])
+
+
+class FakeBLSSession:
+    """Stand-in for the shared requests session that records every POST"""
+
+    def __init__(self):
+        self.fail = True
+        self.posts = 0
+
+    def post(self, *args, **kwargs):
+        self.posts += 1
+        if self.fail:
+            raise requests.exceptions.ConnectionError("BLS unreachable")
+        response = requests.Response()
+        response.status_code = 200
+        response._content = orjson.dumps({"status": "REQUEST_SUCCEEDED", "Results": {"series": []}})
+        return response
+
+
+@pytest.fixture
+def breaker(monkeypatch, tmp_path):
+    """Closed breaker, frozen clock, fake session and empty caches"""
+    now = [1000.0]
+    session = FakeBLSSession()
+    monkeypatch.setattr(bls.time, "time", lambda: now[0])
+    monkeypatch.setattr(bls, "_SESSION", session)
+    monkeypatch.setattr(bls, "_breaker_failures", 0)
+    monkeypatch.setattr(bls, "_breaker_open_until", 0.0)
+    monkeypatch.setattr(bls, "_bls_cache", JsonDiskCache(tmp_path, bls.BLS_CACHE_TTL))
+    monkeypatch.setattr(bls, "_salary_response_memo", {})
+    monkeypatch.setattr(bls, "_occupation_data_memo", {})
+    return session, now
+
+
+class TestCircuitBreaker:
+    """BLS calls are skipped for a cooldown after repeated failures"""
+
+    def _post(self):
+        return bls._post_timeseries(bls._oews_series_ids("17-2141"), 2022, 2024)
+
+    def test_opens_after_threshold_failures(self, breaker):
+        session, _ = breaker
+        for _ in range(bls.BLS_BREAKER_THRESHOLD):
+            assert self._post()["status"] == "REQUEST_FAILED"
+        assert session.posts == bls.BLS_BREAKER_THRESHOLD
+
+        assert self._post() is bls._BREAKER_CIRCUIT_OPEN
+        assert session.posts == bls.BLS_BREAKER_THRESHOLD  # No request while open
+
+    def test_success_resets_failure_count(self, breaker):
+        session, _ = breaker
+        for _ in range(bls.BLS_BREAKER_THRESHOLD - 1):
+            self._post()
+        session.fail = False
+        self._post()
+        session.fail = True
+        for _ in range(bls.BLS_BREAKER_THRESHOLD - 1):
+            self._post()
+
+        assert not bls._breaker_is_open()
+
+    def test_serves_fallback_while_open(self, breaker):
+        session, _ = breaker
+        for _ in range(bls.BLS_BREAKER_THRESHOLD):
+            self._post()
+        posts = session.posts
+
+        data = bls.get_bls_occupation_data("17-2141")
+
+        assert data == bls.FALLBACK_SALARY_DATA["17-2141"]
+        assert session.posts == posts
+
+    def test_closes_after_cooldown(self, breaker):
+        session, now = breaker
+        for _ in range(bls.BLS_BREAKER_THRESHOLD):
+            self._post()
+
+        now[0] += bls.BLS_BREAKER_COOLDOWN - 1
+        assert self._post() is bls._BREAKER_CIRCUIT_OPEN
+
+        now[0] += 2
+        session.fail = False
+        assert self._post()["status"] == "REQUEST_SUCCEEDED"
+        assert session.posts == bls.BLS_BREAKER_THRESHOLD + 1
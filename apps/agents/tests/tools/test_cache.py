@@ -0,0 +1,131 @@
+"""
+Tests for the in-process TTL memo and the on-disk JSON cache
+Also checks that memoized tool results are handed out as copies
+"""
+import pytest
+import orjson
+from tools import cache, scorecard, search
+from tools.cache import JsonDiskCache, TTLMemo
+
+
+class FakeClock:
+    """Stand-in for time.monotonic / time.time that only moves when told to"""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freeze both clocks used by tools.cache"""
+    fake = FakeClock()
+    monkeypatch.setattr(cache.time, "monotonic", fake)
+    monkeypatch.setattr(cache.time, "time", fake)
+    return fake
+
+
+class TestTTLMemo:
+    """TTLMemo expiry and LRU eviction"""
+
+    def test_returns_value_until_ttl_expires(self, clock):
+        memo = TTLMemo(maxsize=4, ttl_seconds=60)
+        memo.set("fiu", 6565)
+
+        clock.now += 59
+        assert memo.get("fiu") == 6565
+
+        clock.now += 2
+        assert memo.get("fiu") is None
+
+    def test_evicts_least_recently_used_when_full(self, clock):
+        memo = TTLMemo(maxsize=2, ttl_seconds=60)
+        memo.set("a", 1)
+        memo.set("b", 2)
+        memo.get("a")  # "b" is now the least recently used
+        memo.set("c", 3)
+
+        assert memo.get("a") == 1
+        assert memo.get("b") is None
+        assert memo.get("c") == 3
+
+    def test_clear_drops_every_entry(self, clock):
+        memo = TTLMemo(maxsize=4, ttl_seconds=60)
+        memo.set("a", 1)
+        memo.clear()
+
+        assert memo.get("a") is None
+
+
+class TestJsonDiskCache:
+    """JsonDiskCache round trips, expiry and damaged entries"""
+
+    def test_round_trip(self, tmp_path, clock):
+        disk = JsonDiskCache(tmp_path, ttl_seconds=60)
+        disk.set(("query", 10), [{"title": "MDC"}])
+
+        assert disk.get(("query", 10)) == [{"title": "MDC"}]
+        assert disk.get(("query", 20)) is None
+
+    def test_expired_entry_is_a_miss(self, tmp_path, clock):
+        disk = JsonDiskCache(tmp_path, ttl_seconds=60)
+        disk.set("key", {"v": 1})
+
+        clock.now += 61
+        assert disk.get("key") is None
+
+    def test_corrupt_file_is_a_miss(self, tmp_path, clock):
+        disk = JsonDiskCache(tmp_path, ttl_seconds=60)
+        disk.set("key", {"v": 1})
+        disk._path_for("key").write_bytes(b"{not json")
+
+        assert disk.get("key") is None
+
+        # The next write replaces the damaged entry
+        disk.set("key", {"v": 2})
+        assert disk.get("key") == {"v": 2}
+
+    def test_leaves_no_temp_files(self, tmp_path, clock):
+        disk = JsonDiskCache(tmp_path, ttl_seconds=60)
+        disk.set("key", {"v": 1})
+
+        assert [p.suffix for p in tmp_path.iterdir()] == [".json"]
+
+
+class TestMemoizedResultsAreCopies:
+    """Editing a returned result must not change what the memo hands out next"""
+
+    def test_college_data(self, monkeypatch):
+        monkeypatch.setattr(scorecard, "_SCORECARD_API_KEY", None)
+        scorecard._college_data_memo.clear()
+
+        first = scorecard.get_college_data("FIU")
+        first["latest.cost.tuition.in_state"] = 0
+
+        assert scorecard.get_college_data("FIU")["latest.cost.tuition.in_state"] == 6565
+
+    def test_search_results(self, monkeypatch, tmp_path):
+        class FakeResponse:
+            content = orjson.dumps({"items": [{"title": "MDC", "link": "https://www.mdc.edu/egr"}]})
+
+            def raise_for_status(self):
+                pass
+
+        class FakeSession:
+            def get(self, *args, **kwargs):
+                return FakeResponse()
+
+        monkeypatch.setattr(search, "_GOOGLE_KEY", "key")
+        monkeypatch.setattr(search, "_GOOGLE_CX", "cx")
+        monkeypatch.setattr(search, "_session", FakeSession)
+        monkeypatch.setattr(search, "_search_cache", JsonDiskCache(tmp_path, 60))
+        search._search_memo.clear()
+
+        first = search.search_education_sites("engineering")
+        first[0]["title"] = "edited"
+        first.append({})
+
+        again = search.search_education_sites("engineering")
+        assert again == [{"title": "MDC", "link": "https://www.mdc.edu/egr", "snippet": "", "domain": "www.mdc.edu"}]
@@ -0,0 +1,36 @@
+"""
+Tests for the search tool: domain extraction
+"""
+from urllib.parse import urlparse
+import pytest
+from tools.search import extract_domain
+
+
+class TestExtractDomain:
+    """The regex fast path must agree with urlparse(url).netloc"""
+
+    @pytest.mark.parametrize("url", [
+        "https://www.fiu.edu/academics",
+        "http://mdc.edu",
+        "https://fiu.edu?q=1",
+        "HTTP://fau.edu#frag",
+        "HTTPS://WWW.UF.EDU/Admissions",     # Uppercase scheme and host
+        "https://mdc.edu:8443/egr?x=1",      # Port
+        "https://user:pw@ucf.edu/path",      # Userinfo
+        "https://user@fiu.edu:443",          # Userinfo and port
+        "https://[::1]:8080/x",              # IPv6 literal
+        "ftp://files.ed.gov/a",
+        "a1+b://host/x",                     # Scheme with + and digits
+        "www.fiu.edu/academics",             # No scheme
+        "fiu.edu",                           # No scheme, host only
+        "//fiu.edu/path",                    # Scheme-relative
+        "https:fiu.edu",                     # Scheme without //
+        "1http://host/x",                    # Invalid scheme
+        "mailto:admissions@fiu.edu",
+        "file:///etc/passwd",                # Empty host
+        "  https://fiu.edu/a",               # Leading whitespace
+        "https://fi\tu.edu/a",               # Tab (stripped by urlparse)
+        "",
+    ])
+    def test_matches_urlparse(self, url):
+        assert extract_domain(url) == urlparse(url).netloc
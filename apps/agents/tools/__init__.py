@@ -1,9 +1,29 @@
 """
 API tool wrappers for external data sources
+
+BLS helpers are loaded lazily on first attribute access (PEP 562), so
+`import tools` does not pay for tools.bls and its HTTP client imports.
 """
 from .search import search_education_sites, extract_program_details
 from .scorecard import get_college_data, get_college_costs
-from .bls import get_salary_data, get_bls_occupation_data, calculate_roi
+
+_LAZY_BLS_EXPORTS = frozenset({
+    "get_salary_data",
+    "get_salary_data_async",
+    "get_salary_data_bulk",
+    "get_salaries_for_careers",
+    "get_bls_occupation_data",
+    "calculate_roi",
+    "calculate_roi_vec",
+})
+
+
+def __getattr__(name):
+    if name in _LAZY_BLS_EXPORTS:
+        from . import bls
+        return getattr(bls, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "search_education_sites",
@@ -11,6 +31,10 @@ __all__ = [
     "get_college_data",
     "get_college_costs",
     "get_salary_data",
+    "get_salary_data_async",
+    "get_salary_data_bulk",
+    "get_salaries_for_careers",
     "get_bls_occupation_data",
     "calculate_roi",
+    "calculate_roi_vec",
 ]
@@ -0,0 +1,24 @@
+"""
+Helpers for running async HTTP fan-outs from the sync tool wrappers
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion from sync code.
+
+    Uses asyncio.run directly, or a worker thread when called from inside a
+    running event loop (e.g. a FastAPI handler), where asyncio.run would fail.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
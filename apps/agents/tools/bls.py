@@ -2,33 +2,285 @@
 BLS (Bureau of Labor Statistics) Public Data API wrapper
 Retrieves salary and job outlook data
 """
+import asyncio
+import functools
 import os
-import json
+import logging
+import sys
+import threading
+import time
+import httpx
+import orjson
 import requests
-from typing import Dict, List, Optional
-from pathlib import Path
-from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Sequence, Tuple
+from urllib3.util.retry import Retry
+from types import MappingProxyType
+from _paths import cache_dir, load_env
+from tools.cache import JsonDiskCache
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import ArrayLike
+
+# Load .env from careerpilot/.env
+load_env()
+
+logger = logging.getLogger(__name__)
+
+# OEWS wages are published yearly, so successful responses are kept for 30 days
+BLS_CACHE_DIR = cache_dir("bls")
+BLS_CACHE_TTL = 30 * 24 * 60 * 60
+
+_bls_cache = JsonDiskCache(BLS_CACHE_DIR, BLS_CACHE_TTL)
+
+BLS_API_V1_URL = "https://api.bls.gov/publicAPI/v1/timeseries/data/"
+BLS_API_V2_URL = "https://api.bls.gov/publicAPI/v2/timeseries/data/"
+
+# Registration key and default endpoint, read once at import (see refresh_bls_config)
+_BLS_API_KEY = os.getenv("BLS_API_KEY")
+_BLS_URL = BLS_API_V2_URL if _BLS_API_KEY else BLS_API_V1_URL
+
+
+def refresh_bls_config() -> None:
+    """Re-read BLS_API_KEY from the environment (for tests that change it)"""
+    global _BLS_API_KEY, _BLS_URL
+    _BLS_API_KEY = os.getenv("BLS_API_KEY")
+    _BLS_URL = BLS_API_V2_URL if _BLS_API_KEY else BLS_API_V1_URL
+
+
+# In-process memo of successful responses / parsed results (failures are never memoized)
+_salary_response_memo: Dict[str, Dict] = {}
+_occupation_data_memo: Dict[str, Dict] = {}
+
+# Shared keep-alive session so repeat calls skip the TCP+TLS handshake.
+# Timeseries queries are read-only, so POSTs are safe to retry on 429/5xx.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset({"POST"}),
+    ),
+))
+
+
+# Compressed responses; brotli is only advertised when urllib3/httpx can decode it
+_BROTLI_AVAILABLE = any(find_spec(module) for module in ("brotli", "brotlicffi"))
+_JSON_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept-Encoding": "gzip, deflate, br" if _BROTLI_AVAILABLE else "gzip, deflate",
+}
+
+# Circuit breaker: after this many consecutive failures, skip the API for the cooldown
+# and let callers use fallback data instead of waiting out another timeout
+BLS_BREAKER_THRESHOLD = 3
+BLS_BREAKER_COOLDOWN = 60  # seconds
+_BREAKER_CIRCUIT_OPEN = {"status": "REQUEST_FAILED", "message": "BLS API temporarily disabled after repeated failures"}
+_breaker_lock = threading.Lock()
+_breaker_failures = 0
+_breaker_open_until = 0.0
+
+
+def _breaker_is_open() -> bool:
+    """True while BLS calls are being skipped after repeated failures"""
+    return time.time() < _breaker_open_until
+
+
+def _breaker_record(succeeded: bool) -> None:
+    """Reset the failure count on success; open the breaker after too many failures"""
+    global _breaker_failures, _breaker_open_until
+    with _breaker_lock:
+        if succeeded:
+            _breaker_failures = 0
+            return
+        _breaker_failures += 1
+        if _breaker_failures >= BLS_BREAKER_THRESHOLD:
+            _breaker_open_until = time.time() + BLS_BREAKER_COOLDOWN
+            _breaker_failures = 0
+            logger.warning("BLS API failed %d times in a row; using fallback data for %ds", BLS_BREAKER_THRESHOLD, BLS_BREAKER_COOLDOWN)
+
+
+def _new_async_client() -> httpx.AsyncClient:
+    """
+    Async client for concurrent BLS calls. Clients are bound to one event loop,
+    so callers open one per batch instead of sharing a module-level instance.
+    """
+    return httpx.AsyncClient(
+        timeout=15,
+        limits=httpx.Limits(max_connections=10),
+        transport=httpx.AsyncHTTPTransport(retries=3),  # Connection-level retries
+    )
+
+
+def close_bls_session() -> None:
+    """Close pooled BLS connections (e.g. in test teardown)"""
+    _SESSION.close()
+
+
+# OEWS data types: 02 = Median hourly wage, 04 = Mean annual wage
+ALL_WAGE_SERIES = ("02", "04")
+# Occupation summaries only need the hourly median (annual = hourly * 2080)
+OCCUPATION_WAGE_SERIES = ("02",)
+
+
+@functools.lru_cache(maxsize=256)
+def _oews_series_ids(occupation_code: str, series_types: Tuple[str, ...] = ALL_WAGE_SERIES) -> Tuple[str, ...]:
+    """
+    Build the OEWS series IDs for an occupation (memoized; known codes are warmed at import).
+
+    For OEWS (Occupational Employment and Wage Statistics)
+    Series ID format: OEUM{occupation_code}{area_code}{data_type}
+    Area code: 0000000 = National
+    Data type: 02 = Median hourly wage, 04 = Mean annual wage
+    """
+    code = occupation_code.replace('-', '')
+    return tuple(f"OEUM{code}00000000{series_type}" for series_type in series_types)
+
+
+def _salary_cache_key(occupation_code: str, start_year: int, end_year: int, series_types: Tuple[str, ...]) -> str:
+    """Cache key for one occupation's salary response"""
+    return f"{occupation_code}:{start_year}:{end_year}:{','.join(series_types)}"
 
-# Load .env from careerpilot/.env (3 levels up from tools/bls.py)
-env_path = Path(__file__).parent.parent.parent.parent / ".env"
-load_dotenv(dotenv_path=env_path)
+
+def _occupation_code_from_series_id(series_id: str) -> str:
+    """Recover "17-2141" from an OEWS series ID (chars 4..10 hold the SOC code)"""
+    code = series_id[4:10]
+    return f"{code[:2]}-{code[2:]}"
+
+
+def _timeseries_request(
+    series_ids: Sequence[str],
+    start_year: int,
+    end_year: int,
+    use_api_v2: bool = True
+) -> Tuple[str, Dict]:
+    """
+    Build the URL and JSON payload for one timeseries query.
+
+    Args:
+        series_ids: Series IDs to fetch (v2 allows 50 per request, v1 allows 25)
+        start_year: Start year for data
+        end_year: End year for data
+        use_api_v2: Use v2 API when a registration key is configured
+
+    Returns:
+        (url, payload)
+    """
+    # API endpoint (v2 needs a registration key)
+    url = _BLS_URL if use_api_v2 else BLS_API_V1_URL
+
+    payload = {
+        "seriesid": series_ids,
+        "startyear": str(start_year),
+        "endyear": str(end_year)
+    }
+
+    # Add registration key if available (increases rate limits)
+    if _BLS_API_KEY:
+        payload["registrationkey"] = _BLS_API_KEY
+
+    return url, payload
+
+
+def _post_timeseries(
+    series_ids: Sequence[str],
+    start_year: int,
+    end_year: int,
+    use_api_v2: bool = True
+) -> Dict:
+    """
+    POST one timeseries query to the BLS API.
+
+    Returns:
+        BLS API response, or {"status": "REQUEST_FAILED", ...} on network errors
+        or while the circuit breaker is open
+    """
+    if _breaker_is_open():
+        return _BREAKER_CIRCUIT_OPEN
+
+    url, payload = _timeseries_request(series_ids, start_year, end_year, use_api_v2)
+
+    try:
+        response = _SESSION.post(url, json=payload, headers=_JSON_HEADERS, timeout=15)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+        logger.warning("BLS API error: %s", e)
+        _breaker_record(succeeded=False)
+        return {"status": "REQUEST_FAILED", "message": str(e)}
+
+    _breaker_record(succeeded=True)
+    return data
+
+
+async def _post_timeseries_async(
+    series_ids: Sequence[str],
+    start_year: int,
+    end_year: int,
+    use_api_v2: bool,
+    client: httpx.AsyncClient
+) -> Dict:
+    """Async counterpart of _post_timeseries using a shared httpx client"""
+    if _breaker_is_open():
+        return _BREAKER_CIRCUIT_OPEN
+
+    url, payload = _timeseries_request(series_ids, start_year, end_year, use_api_v2)
+
+    try:
+        response = await client.post(url, json=payload, headers=_JSON_HEADERS)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+
+    except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+        logger.warning("BLS API error: %s", e)
+        _breaker_record(succeeded=False)
+        return {"status": "REQUEST_FAILED", "message": str(e)}
+
+    _breaker_record(succeeded=True)
+    return data
+
+
+def _cached_salary_data(cache_key: str) -> Optional[Dict]:
+    """Look up a salary response in the in-process memo, then on disk"""
+    if cache_key in _salary_response_memo:
+        return _salary_response_memo[cache_key]
+
+    cached = _bls_cache.get(cache_key)
+    if cached is not None:
+        _salary_response_memo[cache_key] = cached
+    return cached
+
+
+def _remember_salary_data(cache_key: str, data: Dict) -> None:
+    """Store a successful salary response in memory and on disk"""
+    _salary_response_memo[cache_key] = data
+    _bls_cache.set(cache_key, data)
 
 
 def get_salary_data(
     occupation_code: str,
     start_year: int = 2019,
     end_year: int = 2024,
-    use_api_v2: bool = True
+    use_api_v2: bool = True,
+    series_types: Tuple[str, ...] = ALL_WAGE_SERIES
 ) -> Dict:
     """
     Retrieve salary trends for a BLS occupation code.
-    Refactored from BLS sample code.
+    Refactored from BLS sample code. Successful responses are cached in memory
+    and on disk (BLS_CACHE_DIR), keyed by occupation code, year range and series.
 
     Args:
         occupation_code: BLS occupation code (e.g., "17-2141" for Mechanical Engineers)
         start_year: Start year for data
         end_year: End year for data
         use_api_v2: Use v2 API (requires registration key, higher limits)
+        series_types: OEWS data types to request ("02" median hourly, "04" mean annual)
 
     Returns:
         BLS API response with salary time series data
@@ -38,96 +290,189 @@ def get_salary_data(
         >>> series = data["Results"]["series"][0]["data"]
         >>> print(series[0]["value"])  # Latest salary data
     """
-    bls_api_key = os.getenv("BLS_API_KEY")
+    cache_key = _salary_cache_key(occupation_code, start_year, end_year, series_types)
+    cached = _cached_salary_data(cache_key)
+    if cached is not None:
+        return cached
+
+    data = _post_timeseries(_oews_series_ids(occupation_code, series_types), start_year, end_year, use_api_v2)
+
+    if data.get("status") == "REQUEST_SUCCEEDED":
+        _remember_salary_data(cache_key, data)
+
+    return data
+
+
+async def get_salary_data_async(
+    occupation_code: str,
+    start_year: int = 2019,
+    end_year: int = 2024,
+    use_api_v2: bool = True,
+    series_types: Tuple[str, ...] = ALL_WAGE_SERIES,
+    client: Optional[httpx.AsyncClient] = None
+) -> Dict:
+    """
+    Async version of get_salary_data (same cache, non-blocking HTTP).
+
+    Args:
+        occupation_code: BLS occupation code
+        start_year: Start year for data
+        end_year: End year for data
+        use_api_v2: Use v2 API (requires registration key, higher limits)
+        series_types: OEWS data types to request ("02" median hourly, "04" mean annual)
+        client: Shared client for concurrent calls; a temporary one is used if omitted
 
-    # API endpoint
-    if use_api_v2 and bls_api_key:
-        url = "https://api.bls.gov/publicAPI/v2/timeseries/data/"
+    Returns:
+        BLS API response with salary time series data
+    """
+    cache_key = _salary_cache_key(occupation_code, start_year, end_year, series_types)
+    cached = _cached_salary_data(cache_key)
+    if cached is not None:
+        return cached
+
+    series_ids = _oews_series_ids(occupation_code, series_types)
+    if client is None:
+        async with _new_async_client() as client:
+            data = await _post_timeseries_async(series_ids, start_year, end_year, use_api_v2, client)
     else:
-        url = "https://api.bls.gov/publicAPI/v1/timeseries/data/"
+        data = await _post_timeseries_async(series_ids, start_year, end_year, use_api_v2, client)
 
-    headers = {"Content-Type": "application/json"}
+    if data.get("status") == "REQUEST_SUCCEEDED":
+        _remember_salary_data(cache_key, data)
 
-    # For OEWS (Occupational Employment and Wage Statistics)
-    # Series ID format: OEUM{occupation_code}{area_code}{data_type}
-    # Area code: 0000000 = National
-    # Data type: 02 = Median hourly wage, 04 = Mean annual wage
+    return data
 
-    # Get both median hourly and mean annual
-    series_ids = [
-        f"OEUM{occupation_code.replace('-', '')}0000000002",  # Median hourly
-        f"OEUM{occupation_code.replace('-', '')}0000000004",  # Mean annual
-    ]
 
-    payload = {
-        "seriesid": series_ids,
-        "startyear": str(start_year),
-        "endyear": str(end_year)
-    }
+def get_salary_data_bulk(
+    occupation_codes: List[str],
+    start_year: int = 2019,
+    end_year: int = 2024,
+    use_api_v2: bool = True,
+    series_types: Tuple[str, ...] = ALL_WAGE_SERIES
+) -> Dict[str, Dict]:
+    """
+    Retrieve salary trends for several occupations in as few requests as possible.
+    Cached codes are served locally; the rest are packed into shared POSTs
+    (up to 50 series per v2 request, 25 per v1 request).
 
-    # Add registration key if available (increases rate limits)
-    if bls_api_key:
-        payload["registrationkey"] = bls_api_key
+    Args:
+        occupation_codes: BLS occupation codes
+        start_year: Start year for data
+        end_year: End year for data
+        use_api_v2: Use v2 API (requires registration key, higher limits)
+        series_types: OEWS data types to request per occupation
 
-    try:
-        response = requests.post(url, json=payload, headers=headers, timeout=15)
-        response.raise_for_status()
-        return response.json()
+    Returns:
+        Dict of occupation code -> response shaped like get_salary_data()'s
 
-    except requests.exceptions.RequestException as e:
-        print(f"BLS API error: {e}")
-        return {"status": "REQUEST_FAILED", "message": str(e)}
+    Example:
+        >>> data = get_salary_data_bulk(["17-2141", "15-1252"], 2022, 2024)
+        >>> occupation = get_bls_occupation_data("17-2141", salary_data=data["17-2141"])
+    """
+    results = {}
+    missing = []
+    for occupation_code in dict.fromkeys(occupation_codes):
+        cached = _cached_salary_data(_salary_cache_key(occupation_code, start_year, end_year, series_types))
+        if cached is not None:
+            results[occupation_code] = cached
+        else:
+            missing.append(occupation_code)
+
+    max_series = 50 if use_api_v2 and _BLS_API_KEY else 25
+    codes_per_request = max(1, max_series // len(series_types))
+    for i in range(0, len(missing), codes_per_request):
+        batch = missing[i:i + codes_per_request]
+        series_ids = [series_id for code in batch for series_id in _oews_series_ids(code, series_types)]
+        data = _post_timeseries(series_ids, start_year, end_year, use_api_v2)
+
+        if data.get("status") != "REQUEST_SUCCEEDED":
+            results.update((code, data) for code in batch)
+            continue
+
+        # Fan the shared response back out per occupation
+        series_by_code = {code: [] for code in batch}
+        for series in data.get("Results", {}).get("series", []):
+            code = _occupation_code_from_series_id(series.get("seriesID", ""))
+            if code in series_by_code:
+                series_by_code[code].append(series)
+
+        for code, series_list in series_by_code.items():
+            code_data = {"status": data["status"], "Results": {"series": series_list}}
+            if series_list:
+                _remember_salary_data(_salary_cache_key(code, start_year, end_year, series_types), code_data)
+            results[code] = code_data
 
+    return results
 
-def get_bls_occupation_data(occupation_code: str) -> Dict[str, any]:
+
+# OEWS data type suffix of a series ID -> wage field it holds
+_SERIES_SUFFIX_FIELDS = {"02": "median_hourly", "04": "mean_annual"}
+
+
+def get_bls_occupation_data(occupation_code: str, salary_data: Optional[Dict] = None) -> Dict[str, any]:
     """
     Get formatted occupation data (salary, growth, etc.)
+    Parsed results from successful API calls are memoized per occupation code.
+
+    Only the median hourly series is fetched; annual figures are extrapolated
+    as hourly * 2080 (40 hours/week * 52 weeks). A prefetched response that
+    includes the mean annual series still uses it for mean_annual_wage.
 
     Args:
         occupation_code: BLS occupation code
+        salary_data: Response already fetched for this code (e.g. from get_salary_data_bulk)
 
     Returns:
         Formatted salary and job outlook data
     """
-    data = get_salary_data(occupation_code, start_year=2022, end_year=2024)
+    if occupation_code in _occupation_data_memo:
+        return _occupation_data_memo[occupation_code]
+
+    data = salary_data if salary_data is not None else get_salary_data(
+        occupation_code, start_year=2022, end_year=2024, series_types=OCCUPATION_WAGE_SERIES
+    )
 
     if data.get("status") != "REQUEST_SUCCEEDED":
-        print(f"WARNING: BLS API failed for {occupation_code}. Using fallback data.")
+        logger.warning("BLS API failed for %s. Using fallback data.", occupation_code)
         return _get_fallback_salary_data(occupation_code)
 
     results = data.get("Results", {})
     series_list = results.get("series", [])
 
-    median_hourly = None
-    mean_annual = None
-
+    # Latest value per wage field, stopping once every field is found
+    values = {}
+    data_year = None
     for series in series_list:
-        series_id = series.get("seriesID", "")
         series_data = series.get("data", [])
-
         if not series_data:
             continue
 
         # Get most recent data point
         latest = series_data[0]
-        value = float(latest.get("value", 0))
+        data_year = latest.get("year")
+        field = _SERIES_SUFFIX_FIELDS.get(series.get("seriesID", "")[-2:])
+        if field:
+            values[field] = float(latest.get("value", 0))
+            if len(values) == len(_SERIES_SUFFIX_FIELDS):
+                break
 
-        if series_id.endswith("02"):  # Median hourly
-            median_hourly = value
-        elif series_id.endswith("04"):  # Mean annual
-            mean_annual = value
+    median_hourly = values.get("median_hourly")
+    annual_from_hourly = median_hourly * 2080 if median_hourly else None  # 40 hours/week * 52 weeks
 
     # Calculate annual from hourly if needed
-    if median_hourly and not mean_annual:
-        mean_annual = median_hourly * 2080  # 40 hours/week * 52 weeks
+    mean_annual = values.get("mean_annual")
+    if annual_from_hourly and not mean_annual:
+        mean_annual = annual_from_hourly
 
-    return {
+    occupation_data = {
         "occupation_code": occupation_code,
         "median_hourly_wage": median_hourly,
         "mean_annual_wage": mean_annual,
-        "median_annual_salary": median_hourly * 2080 if median_hourly else mean_annual,
-        "data_year": series_data[0].get("year") if series_data else None
+        "median_annual_salary": annual_from_hourly if annual_from_hourly is not None else mean_annual,
+        "data_year": data_year
     }
+    _occupation_data_memo[occupation_code] = occupation_data
+    return occupation_data
 
 
 def calculate_roi(
@@ -171,9 +516,44 @@ def calculate_roi(
     return roi_years
 
 
+def calculate_roi_vec(
+    median_salary: "ArrayLike",
+    education_cost: "ArrayLike",
+    years_in_school: "ArrayLike" = 4.0,
+    tax_rate: "ArrayLike" = 0.25
+) -> "np.ndarray":
+    """
+    Vectorized calculate_roi for sensitivity grids (inputs broadcast together).
+
+    Args:
+        median_salary: Expected annual salaries after graduation
+        education_cost: Total costs of education
+        years_in_school: Years spent in school (opportunity cost)
+        tax_rate: Effective tax rates
+
+    Returns:
+        Years to break even per scenario (inf where after-tax salary <= 0)
+
+    Example:
+        >>> calculate_roi_vec([95000, 60000], [30000, 80000])
+        array([1.8245614, 4.       ])
+    """
+    # numpy is only needed here, so importing tools.bls does not load it
+    import numpy as np
+
+    net_salary = np.asarray(median_salary, dtype=np.float64) * (1 - np.asarray(tax_rate, dtype=np.float64))
+    total_investment = np.asarray(education_cost, dtype=np.float64) + 25000.0 * np.asarray(years_in_school, dtype=np.float64)
+    net_salary, total_investment = np.broadcast_arrays(net_salary, total_investment)
+
+    roi_years = np.full(net_salary.shape, np.inf)
+    np.divide(total_investment, net_salary, out=roi_years, where=net_salary > 0)
+    return roi_years
+
+
 # Mapping of common careers to BLS occupation codes
 # Source: https://www.bls.gov/soc/2018/major_groups.htm
-CAREER_TO_BLS_CODE = {
+# Read-only; keys are interned so exact hits on interned lookups compare by identity
+CAREER_TO_BLS_CODE = MappingProxyType({sys.intern(career): code for career, code in {
     "mechanical engineer": "17-2141",
     "electrical engineer": "17-2071",
     "civil engineer": "17-2051",
@@ -193,7 +573,13 @@ CAREER_TO_BLS_CODE = {
     "teacher": "25-2021",
     "lawyer": "23-1011",
     "paralegal": "23-2011",
-}
+}.items()})
+
+# Warm the series ID cache for every mapped occupation
+for _code in set(CAREER_TO_BLS_CODE.values()):
+    _oews_series_ids(_code, ALL_WAGE_SERIES)
+    _oews_series_ids(_code, OCCUPATION_WAGE_SERIES)
+del _code
 
 
 def get_bls_code_for_career(career: str) -> Optional[str]:
@@ -206,13 +592,19 @@ def get_bls_code_for_career(career: str) -> Optional[str]:
     Returns:
         BLS occupation code or None
     """
-    career_lower = career.lower().strip()
+    return _bls_code_for_normalized_career(sys.intern(career.lower().strip()))
 
+
+@functools.lru_cache(maxsize=256)
+def _bls_code_for_normalized_career(career_lower: str) -> Optional[str]:
+    """Lookup behind get_bls_code_for_career, memoized per normalized name"""
     # Direct match
-    if career_lower in CAREER_TO_BLS_CODE:
+    try:
         return CAREER_TO_BLS_CODE[career_lower]
+    except KeyError:
+        pass
 
-    # Fuzzy match (contains)
+    # Fuzzy match (contains), first key in table order wins
     for key, code in CAREER_TO_BLS_CODE.items():
         if key in career_lower or career_lower in key:
             return code
@@ -233,12 +625,46 @@ def get_salary_for_career(career: str) -> Optional[Dict]:
     bls_code = get_bls_code_for_career(career)
 
     if not bls_code:
-        print(f"No BLS code found for career: {career}")
+        logger.warning("No BLS code found for career: %s", career)
         return None
 
     return get_bls_occupation_data(bls_code)
 
 
+async def get_salaries_for_careers(careers: List[str]) -> Dict[str, Optional[Dict]]:
+    """
+    Get salary data for several careers, fetching from BLS concurrently.
+
+    Args:
+        careers: Career names
+
+    Returns:
+        Dict of career -> formatted salary data (None if no BLS code matches)
+    """
+    codes = {career: get_bls_code_for_career(career) for career in careers}
+    unique_codes = [code for code in dict.fromkeys(codes.values()) if code]
+
+    async with _new_async_client() as client:
+        responses = await asyncio.gather(*[
+            get_salary_data_async(
+                code, start_year=2022, end_year=2024, series_types=OCCUPATION_WAGE_SERIES, client=client
+            )
+            for code in unique_codes
+        ])
+
+    occupation_data = {
+        code: get_bls_occupation_data(code, salary_data=response)
+        for code, response in zip(unique_codes, responses)
+    }
+
+    results = {}
+    for career, code in codes.items():
+        if not code:
+            logger.warning("No BLS code found for career: %s", career)
+        results[career] = occupation_data.get(code)
+    return results
+
+
 # Job growth projections (2023-2033) - would be fetched from BLS in production
 # Source: https://www.bls.gov/emp/tables/occupational-projections-and-characteristics.htm
 JOB_GROWTH_DATA = {
@@ -259,54 +685,60 @@ def get_job_outlook(occupation_code: str) -> Dict[str, str]:
     )
 
 
+# Realistic salary estimates for common occupations, used when the BLS API is unavailable
+FALLBACK_SALARY_DATA = {
+    "17-2141": {  # Mechanical Engineers
+        "occupation_code": "17-2141",
+        "median_hourly_wage": 45.50,
+        "mean_annual_wage": 95300,
+        "median_annual_salary": 94640,
+        "data_year": "2024"
+    },
+    "17-2071": {  # Electrical Engineers
+        "occupation_code": "17-2071",
+        "median_hourly_wage": 50.25,
+        "mean_annual_wage": 107540,
+        "median_annual_salary": 104520,
+        "data_year": "2024"
+    },
+    "15-1252": {  # Software Developers
+        "occupation_code": "15-1252",
+        "median_hourly_wage": 55.00,
+        "mean_annual_wage": 120730,
+        "median_annual_salary": 114400,
+        "data_year": "2024"
+    },
+    "29-1141": {  # Registered Nurses
+        "occupation_code": "29-1141",
+        "median_hourly_wage": 38.50,
+        "mean_annual_wage": 81220,
+        "median_annual_salary": 80080,
+        "data_year": "2024"
+    },
+    "17-2051": {  # Civil Engineers
+        "occupation_code": "17-2051",
+        "median_hourly_wage": 42.50,
+        "mean_annual_wage": 89940,
+        "median_annual_salary": 88400,
+        "data_year": "2024"
+    }
+}
+
+
 def _get_fallback_salary_data(occupation_code: str) -> Dict[str, any]:
     """
     Fallback salary data when BLS API is unavailable.
     Returns realistic estimates for common occupations.
     """
-    fallback_salaries = {
-        "17-2141": {  # Mechanical Engineers
-            "occupation_code": "17-2141",
-            "median_hourly_wage": 45.50,
-            "mean_annual_wage": 95300,
-            "median_annual_salary": 94640,
-            "data_year": "2024"
-        },
-        "17-2071": {  # Electrical Engineers
-            "occupation_code": "17-2071",
-            "median_hourly_wage": 50.25,
-            "mean_annual_wage": 107540,
-            "median_annual_salary": 104520,
-            "data_year": "2024"
-        },
-        "15-1252": {  # Software Developers
-            "occupation_code": "15-1252",
-            "median_hourly_wage": 55.00,
-            "mean_annual_wage": 120730,
-            "median_annual_salary": 114400,
-            "data_year": "2024"
-        },
-        "29-1141": {  # Registered Nurses
-            "occupation_code": "29-1141",
-            "median_hourly_wage": 38.50,
-            "mean_annual_wage": 81220,
-            "median_annual_salary": 80080,
-            "data_year": "2024"
-        },
-        "17-2051": {  # Civil Engineers
-            "occupation_code": "17-2051",
-            "median_hourly_wage": 42.50,
-            "mean_annual_wage": 89940,
-            "median_annual_salary": 88400,
-            "data_year": "2024"
-        }
-    }
+    if occupation_code in FALLBACK_SALARY_DATA:
+        return dict(FALLBACK_SALARY_DATA[occupation_code])
+
+    logger.warning("No fallback data for occupation code: %s", occupation_code)
+    return _generic_fallback_salary_data(occupation_code)
 
-    if occupation_code in fallback_salaries:
-        return fallback_salaries[occupation_code]
 
-    # Generic fallback
-    print(f"No fallback data for occupation code: {occupation_code}")
+def _generic_fallback_salary_data(occupation_code: str) -> Dict[str, any]:
+    """Generic salary estimate for occupations without specific fallback data"""
     return {
         "occupation_code": occupation_code,
         "median_hourly_wage": 30.00,
@@ -315,3 +747,40 @@ def _get_fallback_salary_data(occupation_code: str) -> Dict[str, any]:
         "data_year": "2024",
         "note": "Estimated fallback data"
     }
+
+
+def _build_career_profile(occupation_code: str) -> Mapping[str, Any]:
+    """Join fallback salary and growth projection for one occupation into a read-only record"""
+    # Generic estimates keep their "Estimated fallback data" note
+    salary = FALLBACK_SALARY_DATA.get(occupation_code) or _generic_fallback_salary_data(occupation_code)
+    return MappingProxyType({**salary, **get_job_outlook(occupation_code)})
+
+
+# Denormalized career -> code + offline salary + outlook, so one lookup resolves a career
+_CAREER_PROFILE_BY_CODE = {code: _build_career_profile(code) for code in set(CAREER_TO_BLS_CODE.values())}
+CAREER_PROFILE = MappingProxyType({
+    career: _CAREER_PROFILE_BY_CODE[code] for career, code in CAREER_TO_BLS_CODE.items()
+})
+
+
+def get_career_profile(career: str) -> Optional[Mapping[str, Any]]:
+    """
+    Get the offline profile for a career (BLS code, fallback salary, growth outlook).
+
+    Args:
+        career: Career name (e.g., "Mechanical Engineer")
+
+    Returns:
+        Read-only profile, or None if the career maps to no BLS code
+
+    Example:
+        >>> get_career_profile("Software Engineer")["growth_rate"]
+        '21%'
+    """
+    profile = CAREER_PROFILE.get(career.lower().strip())
+    if profile is not None:
+        return profile
+
+    # Fuzzy match through the BLS code table
+    code = get_bls_code_for_career(career)
+    return _CAREER_PROFILE_BY_CODE.get(code) if code else None
@@ -0,0 +1,119 @@
+"""
+On-disk JSON cache with per-entry TTL
+Memoizes slow upstream calls (Gemini, external APIs) across process restarts
+"""
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Hashable, Optional
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(data: Any) -> str:
+    """
+    Build a stable cache key from JSON-serializable data.
+
+    Args:
+        data: Any JSON-serializable value (dict key order does not matter)
+
+    Returns:
+        Hex digest usable as a file name
+    """
+    canonical = orjson.dumps(data, option=orjson.OPT_SORT_KEYS, default=str)
+    return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
+
+class JsonDiskCache:
+    """Stores one JSON file per key (any JSON-serializable value) under a cache directory"""
+
+    def __init__(self, directory: Path, ttl_seconds: float):
+        """
+        Args:
+            directory: Directory holding cache entries (created on first write)
+            ttl_seconds: Entries older than this are treated as misses
+        """
+        self.directory = Path(directory)
+        self.ttl_seconds = ttl_seconds
+
+    def _path_for(self, key: Any) -> Path:
+        return self.directory / f"{make_cache_key(key)}.json"
+
+    def get(self, key: Any) -> Optional[Any]:
+        """Return the cached payload for key, or None if missing/expired"""
+        try:
+            with open(self._path_for(key), 'rb') as f:
+                entry = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+
+        if time.time() - entry.get("ts", 0) > self.ttl_seconds:
+            return None
+
+        return entry.get("payload")
+
+    def set(self, key: Any, payload: Any) -> None:
+        """Store payload for key (failures are logged, never raised)"""
+        path = self._path_for(key)
+        tmp_path = None
+        try:
+            data = orjson.dumps({"ts": time.time(), "payload": payload})
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Unique temp file per writer, so concurrent writes of one key never share a file
+            with tempfile.NamedTemporaryFile(dir=self.directory, suffix=".tmp", delete=False) as f:
+                tmp_path = f.name
+                f.write(data)
+            os.replace(tmp_path, path)
+        except (OSError, orjson.JSONEncodeError) as e:
+            logger.warning("[Cache] Failed to write cache entry: %s", e)
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+
+class TTLMemo:
+    """Thread-safe in-process LRU memo whose entries expire after a TTL"""
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        """
+        Args:
+            maxsize: Maximum number of entries (least recently used are evicted)
+            ttl_seconds: Entries older than this are treated as misses
+        """
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the memoized value for key, or None if missing/expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Memoize value for key, evicting the least recently used entry if full"""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        with self._lock:
+            self._entries.clear()
@@ -2,15 +2,99 @@
 College Scorecard API wrapper
 Retrieves tuition, completion rates, and other institutional data
 """
+import asyncio
+import functools
 import os
-import requests
-from typing import Dict, Optional, List
-from pathlib import Path
-from dotenv import load_dotenv
+import threading
+import orjson
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Optional, List, Tuple
+from types import MappingProxyType
+from _paths import cache_dir, load_env
+from tools._aio import run_sync
+from tools.cache import JsonDiskCache, TTLMemo
+
+if TYPE_CHECKING:
+    import httpx
+    import requests
+
+load_env()
+
+# Read once at import; call reload_env() after changing the environment
+_SCORECARD_API_KEY = os.getenv("SCORECARD_API_KEY")
+
+
+def reload_env() -> None:
+    """Re-load .env and re-read SCORECARD_API_KEY (for tests that change it)"""
+    global _SCORECARD_API_KEY
+    load_env(override=True)
+    _SCORECARD_API_KEY = os.getenv("SCORECARD_API_KEY")
+    _college_data_memo.clear()
+    _college_costs_memo.clear()
+
+
+# requests/httpx are imported on first API call, so the no-key (seed data)
+# path never pays for them at import time
+@functools.lru_cache(maxsize=1)
+def _session() -> "requests.Session":
+    """Shared session so repeated Scorecard lookups reuse pooled keep-alive connections"""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    ))
+    return session
+
+
+def _get_json(url: str, params: Dict) -> Optional[Dict]:
+    """GET a Scorecard endpoint on the shared session (None on network / decode errors)"""
+    import requests
 
-# Load .env from careerpilot/.env (3 levels up from tools/scorecard.py)
-env_path = Path(__file__).parent.parent.parent.parent / ".env"
-load_dotenv(dotenv_path=env_path)
+    try:
+        response = _session().get(url, params=params, timeout=10)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+        print(f"College Scorecard API error: {e}")
+        return None
+
+
+SCORECARD_FIELDS = ",".join([
+    "id",
+    "school.name",
+    "school.city",
+    "school.state",
+    "latest.cost.tuition.in_state",
+    "latest.cost.tuition.out_of_state",
+    "latest.cost.attendance.academic_year",
+    "latest.admissions.admission_rate.overall",
+    "latest.completion.completion_rate_4yr_150nt",
+    "latest.student.size",
+    "latest.cost.avg_net_price.overall"
+])
+
+# Largest page the Scorecard API serves (used by batched multi-school queries)
+SCORECARD_MAX_PER_PAGE = 100
+
+# Scorecard data changes yearly: API records are cached on disk for a day
+# and memoized in-process for an hour
+SCORECARD_CACHE_DIR = cache_dir("scorecard")
+SCORECARD_CACHE_TTL = 24 * 60 * 60
+SCORECARD_MEMO_TTL = 60 * 60
+_scorecard_cache = JsonDiskCache(SCORECARD_CACHE_DIR, SCORECARD_CACHE_TTL)
+_college_data_memo = TTLMemo(maxsize=256, ttl_seconds=SCORECARD_MEMO_TTL)
+# Parsed cost breakdowns, so repeat estimates (e.g. the FIU default) are pure arithmetic
+_college_costs_memo = TTLMemo(maxsize=256, ttl_seconds=SCORECARD_MEMO_TTL)
 
 
 def get_college_data(institution_name: str) -> Optional[Dict]:
@@ -28,49 +112,121 @@ def get_college_data(institution_name: str) -> Optional[Dict]:
         >>> print(data["latest.cost.tuition.in_state"])
         6565
     """
-    api_key = os.getenv("SCORECARD_API_KEY")
+    data = _college_data(normalize_institution_name(institution_name))
+    # Memoized records are shared, so callers get their own copy
+    return None if data is None else dict(data)
 
-    if not api_key:
+
+def _college_data(institution_name: str) -> Optional[Dict]:
+    """Lookup behind get_college_data (returns the shared memoized record; do not mutate)"""
+    cached = _cached_college_data(institution_name)
+    if cached is not None:
+        return cached
+
+    if not _SCORECARD_API_KEY:
         print("WARNING: Missing SCORECARD_API_KEY in environment. Using fallback data.")
-        return _get_fallback_college_data(institution_name)
+        data = _get_fallback_college_data(institution_name)
+        # Seed data is only memoized in-process, never written to the disk cache
+        _college_data_memo.set(institution_name, data)
+        return data
+
+    data = _fetch_college_data(institution_name, _SCORECARD_API_KEY)
+
+    # Failures / empty results are never cached
+    if data is not None:
+        _remember_college_data(institution_name, data)
+    return data
+
+
+def _cached_college_data(institution_name: str) -> Optional[Dict]:
+    """Look up a school record in the in-process memo, then on disk"""
+    cached = _college_data_memo.get(institution_name)
+    if cached is None:
+        cached = _scorecard_cache.get(institution_name)
+        if cached is not None:
+            _college_data_memo.set(institution_name, cached)
+    return cached
+
+
+def _remember_college_data(institution_name: str, data: Dict) -> None:
+    """Store a school record from the API in memory and on disk"""
+    _college_data_memo.set(institution_name, data)
+    _scorecard_cache.set(institution_name, data)
+
+
+def _fetch_college_data(institution_name: str, api_key: str) -> Optional[Dict]:
+    """GET one school record from the Scorecard API (None on errors / no results)"""
+    url, params = _college_data_request(institution_name, api_key)
+    data = _get_json(url, params)
+    return None if data is None else _first_result(data, institution_name)
+
+
+async def _get_college_data_async(institution_name: str, api_key: str, client: "httpx.AsyncClient") -> Optional[Dict]:
+    """Async counterpart of get_college_data using a shared httpx client"""
+    import httpx
+
+    institution_name = normalize_institution_name(institution_name)
+
+    cached = _cached_college_data(institution_name)
+    if cached is not None:
+        return cached
+
+    url, params = _college_data_request(institution_name, api_key)
+
+    try:
+        response = await client.get(url, params=params)
+        response.raise_for_status()
+        data = _first_result(orjson.loads(response.content), institution_name)
 
+    except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+        print(f"College Scorecard API error: {e}")
+        return None
+
+    if data is not None:
+        _remember_college_data(institution_name, data)
+    return data
+
+
+def _college_data_request(institution_name: str, api_key: str) -> Tuple[str, Dict]:
+    """Build the URL and query params for one Scorecard school lookup"""
     url = "https://api.data.gov/ed/collegescorecard/v1/schools"
     params = {
         "api_key": api_key,
         "school.name": institution_name,
-        "fields": ",".join([
-            "id",
-            "school.name",
-            "school.city",
-            "school.state",
-            "latest.cost.tuition.in_state",
-            "latest.cost.tuition.out_of_state",
-            "latest.cost.attendance.academic_year",
-            "latest.admissions.admission_rate.overall",
-            "latest.completion.completion_rate_4yr_150nt",
-            "latest.student.size",
-            "latest.cost.avg_net_price.overall"
-        ])
+        "fields": SCORECARD_FIELDS
     }
+    return url, params
 
-    try:
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
 
-        if not data.get("results"):
-            print(f"No results found for institution: {institution_name}")
-            return None
+def _first_result(data: Dict, institution_name: str) -> Optional[Dict]:
+    """Return the most relevant school from a Scorecard response"""
+    if not data.get("results"):
+        print(f"No results found for institution: {institution_name}")
+        return None
 
-        # Return first result (most relevant)
-        return data["results"][0]
+    # Return first result (most relevant)
+    return data["results"][0]
 
-    except requests.exceptions.RequestException as e:
-        print(f"College Scorecard API error: {e}")
-        return None
 
+@dataclass(frozen=True, slots=True)
+class CollegeCosts:
+    """Simplified yearly cost breakdown for one institution (immutable, so memoized values are safe to share)"""
+    in_state_tuition: float = 0.0
+    out_of_state_tuition: float = 0.0
+    net_price: float = 0.0
+    total_cost_of_attendance: float = 0.0
 
-def get_college_costs(institution_name: str) -> Dict[str, float]:
+    def to_dict(self) -> Dict[str, float]:
+        """Mapping form, for callers that serialize or index by field name"""
+        return {
+            "in_state_tuition": self.in_state_tuition,
+            "out_of_state_tuition": self.out_of_state_tuition,
+            "net_price": self.net_price,
+            "total_cost_of_attendance": self.total_cost_of_attendance
+        }
+
+
+def get_college_costs(institution_name: str) -> CollegeCosts:
     """
     Get simplified cost breakdown for an institution.
 
@@ -78,51 +234,65 @@ def get_college_costs(institution_name: str) -> Dict[str, float]:
         institution_name: Name of institution
 
     Returns:
-        Dictionary with tuition, fees, and net price
+        CollegeCosts with tuition, net price and cost of attendance (zeros if lookup fails)
 
     Example:
         >>> costs = get_college_costs("FIU")
-        >>> print(costs["in_state_tuition"])
-        6565
+        >>> print(costs.in_state_tuition)
+        6565.0
     """
-    data = get_college_data(institution_name)
+    institution_name = normalize_institution_name(institution_name)
 
-    if not data:
-        return {
-            "in_state_tuition": 0.0,
-            "out_of_state_tuition": 0.0,
-            "net_price": 0.0,
-            "total_cost_of_attendance": 0.0
-        }
+    cached = _college_costs_memo.get(institution_name)
+    if cached is not None:
+        return cached
+
+    data = _college_data(institution_name)
+    costs = _parse_college_costs(data)
 
-    # Handle both flat and nested response formats
-    # Flat: {"latest.cost.tuition.in_state": 6565}
-    # Nested: {"latest": {"cost": {"tuition": {"in_state": 6565}}}}
+    # Failed lookups are never memoized
+    if data:
+        _college_costs_memo.set(institution_name, costs)
+    return costs
+
+
+# Scorecard returns cost fields either flat ({"latest.cost.tuition.in_state": 6565})
+# or nested ({"latest": {"cost": {"tuition": {"in_state": 6565}}}}); both layouts
+# share the same dotted path per output field.
+_COST_FIELD_PATHS = {
+    "in_state_tuition": "latest.cost.tuition.in_state",
+    "out_of_state_tuition": "latest.cost.tuition.out_of_state",
+    "net_price": "latest.cost.avg_net_price.overall",
+    "total_cost_of_attendance": "latest.cost.attendance.academic_year",
+}
+_NESTED_COST_FIELD_PATHS = {
+    field: tuple(path.split(".")) for field, path in _COST_FIELD_PATHS.items()
+}
+_EMPTY_COSTS = CollegeCosts()
+
+
+def _walk(data: Dict, path: Tuple[str, ...]):
+    """Follow a key path through nested dicts (None if any level is missing)"""
+    node = data
+    for key in path:
+        if not isinstance(node, dict):
+            return None
+        node = node.get(key)
+    return node
+
+
+def _parse_college_costs(data: Optional[Dict]) -> CollegeCosts:
+    """Reduce a Scorecard school record to the cost fields we use"""
+    if not data:
+        return _EMPTY_COSTS
 
     if "latest.cost.tuition.in_state" in data:
-        # Flat format
-        return {
-            "in_state_tuition": float(data.get("latest.cost.tuition.in_state") or 0),
-            "out_of_state_tuition": float(data.get("latest.cost.tuition.out_of_state") or 0),
-            "net_price": float(data.get("latest.cost.avg_net_price.overall") or 0),
-            "total_cost_of_attendance": float(data.get("latest.cost.attendance.academic_year") or 0)
-        }
-    else:
-        # Nested format
-        latest = data.get("latest", {})
-        cost = latest.get("cost", {})
-        tuition = cost.get("tuition", {})
-        attendance = cost.get("attendance", {})
+        return CollegeCosts(**{field: float(data.get(path) or 0) for field, path in _COST_FIELD_PATHS.items()})
 
-        return {
-            "in_state_tuition": float(tuition.get("in_state") or 0),
-            "out_of_state_tuition": float(tuition.get("out_of_state") or 0),
-            "net_price": float(cost.get("avg_net_price", {}).get("overall") or 0),
-            "total_cost_of_attendance": float(attendance.get("academic_year") or 0)
-        }
+    return CollegeCosts(**{field: float(_walk(data, path) or 0) for field, path in _NESTED_COST_FIELD_PATHS.items()})
 
 
-def get_multiple_college_costs(institution_names: List[str]) -> Dict[str, Dict]:
+def get_multiple_college_costs(institution_names: List[str]) -> Dict[str, CollegeCosts]:
     """
     Get costs for multiple institutions.
 
@@ -130,14 +300,89 @@ def get_multiple_college_costs(institution_names: List[str]) -> Dict[str, Dict]:
         institution_names: List of institution names
 
     Returns:
-        Dictionary mapping institution name to cost data
+        Dictionary mapping institution name to CollegeCosts
+
+    Note:
+        With an API key, uncached schools are fetched in one batched request;
+        any the batch cannot match exactly are looked up concurrently.
+    """
+    # Fallback data is local, so only batch when we will actually hit the API
+    if not _SCORECARD_API_KEY or len(institution_names) < 2:
+        return {name: get_college_costs(name) for name in institution_names}
+
+    normalized = {name: normalize_institution_name(name) for name in institution_names}
+
+    records: Dict[str, Optional[Dict]] = {}
+    pending = []
+    for key in dict.fromkeys(normalized.values()):
+        if _college_costs_memo.get(key) is not None:
+            continue
+        cached = _cached_college_data(key)
+        if cached is not None:
+            records[key] = cached
+        else:
+            pending.append(key)
+
+    if len(pending) > 1:
+        records.update(_fetch_college_data_batch(pending, _SCORECARD_API_KEY))
+
+    remaining = [n for n in pending if n not in records]
+    if remaining:
+        fetched = run_sync(_get_multiple_college_data_async(remaining, _SCORECARD_API_KEY))
+        records.update(zip(remaining, fetched))
+
+    for name, data in records.items():
+        if data:
+            _college_costs_memo.set(name, _parse_college_costs(data))
+
+    return {
+        name: _college_costs_memo.get(key) or _parse_college_costs(records.get(key))
+        for name, key in normalized.items()
+    }
+
+
+def _fetch_college_data_batch(institution_names: List[str], api_key: str) -> Dict[str, Dict]:
     """
-    results = {}
+    Fetch several schools with one comma-separated Scorecard query.
 
-    for name in institution_names:
-        results[name] = get_college_costs(name)
+    The API matches names loosely, so only results whose school.name equals a
+    requested name (case-insensitively) are returned; callers look up the rest
+    individually.
 
-    return results
+    Returns:
+        Dict of requested name -> school record (missing names are absent)
+    """
+    url, params = _college_data_request(",".join(institution_names), api_key)
+    params["per_page"] = SCORECARD_MAX_PER_PAGE
+
+    data = _get_json(url, params)
+    if data is None:
+        return {}
+    results = data.get("results") or []
+
+    wanted = {name.lower(): name for name in institution_names}
+    records = {}
+    for result in results:
+        name = wanted.get(str(result.get("school.name", "")).lower())
+        if name is not None and name not in records:
+            records[name] = result
+            _remember_college_data(name, result)
+    return records
+
+
+async def _get_multiple_college_data_async(institution_names: List[str], api_key: str) -> List[Optional[Dict]]:
+    """Fetch Scorecard records for several institutions concurrently over one client"""
+    import httpx
+
+    async with httpx.AsyncClient(
+        timeout=10,
+        limits=httpx.Limits(max_connections=20),
+        transport=httpx.AsyncHTTPTransport(retries=3),
+    ) as client:
+        return await asyncio.gather(*[
+            _get_college_data_async(name, api_key, client)
+            for name in institution_names
+        ])
 
 
 def estimate_total_education_cost(
@@ -164,8 +409,10 @@ def estimate_total_education_cost(
 
     # Get university costs
     university_costs = get_college_costs(university_name)
-    tuition_key = "in_state_tuition" if is_florida_resident else "out_of_state_tuition"
-    university_cost_per_year = university_costs.get(tuition_key, 10000)
+    if is_florida_resident:
+        university_cost_per_year = university_costs.in_state_tuition
+    else:
+        university_cost_per_year = university_costs.out_of_state_tuition
     university_total = university_cost_per_year * university_years
 
     # Estimate fees (typically 10-15% of tuition)
@@ -191,8 +438,9 @@ def estimate_total_education_cost(
     }
 
 
-# Common Florida institutions mapping (for fuzzy matching)
-INSTITUTION_ALIASES = {
+# Common Florida institutions mapping (for fuzzy matching).
+# Read-only because normalize_institution_name memoizes lookups against it.
+INSTITUTION_ALIASES = MappingProxyType({
     "mdc": "Miami Dade College",
     "fiu": "Florida International University",
     "fau": "Florida Atlantic University",
@@ -202,18 +450,176 @@ INSTITUTION_ALIASES = {
     "usf": "University of South Florida",
     "mit": "Massachusetts Institute of Technology",
     "georgia tech": "Georgia Institute of Technology",
-}
+})
 
 
+@functools.lru_cache(maxsize=1024)
 def normalize_institution_name(name: str) -> str:
-    """Normalize institution name for API query"""
-    name_lower = name.lower().strip()
+    """Normalize institution name for API query (memoized; agents repeat the same names)"""
+    return INSTITUTION_ALIASES.get(name.lower().strip(), name)
 
-    # Check aliases first
-    if name_lower in INSTITUTION_ALIASES:
-        return INSTITUTION_ALIASES[name_lower]
 
-    return name
+# Realistic seed data for common institutions, used when SCORECARD_API_KEY is not set
+_FALLBACK_COLLEGE_DATA = {
+    "Florida International University": {
+        "id": 133951,
+        "school.name": "Florida International University",
+        "school.city": "Miami",
+        "school.state": "FL",
+        "latest.cost.tuition.in_state": 6565,
+        "latest.cost.tuition.out_of_state": 18566,
+        "latest.cost.attendance.academic_year": 21000,
+        "latest.admissions.admission_rate.overall": 0.64,
+        "latest.completion.completion_rate_4yr_150nt": 0.52,
+        "latest.student.size": 56851,
+        "latest.cost.avg_net_price.overall": 8500
+    },
+    "Miami Dade College": {
+        "id": 135726,
+        "school.name": "Miami Dade College",
+        "school.city": "Miami",
+        "school.state": "FL",
+        "latest.cost.tuition.in_state": 3400,
+        "latest.cost.tuition.out_of_state": 12000,
+        "latest.cost.attendance.academic_year": 10000,
+        "latest.admissions.admission_rate.overall": 1.0,
+        "latest.completion.completion_rate_4yr_150nt": 0.23,
+        "latest.student.size": 50000,
+        "latest.cost.avg_net_price.overall": 4200
+    },
+    "University of Florida": {
+        "id": 134130,
+        "school.name": "University of Florida",
+        "school.city": "Gainesville",
+        "school.state": "FL",
+        "latest.cost.tuition.in_state": 6380,
+        "latest.cost.tuition.out_of_state": 28658,
+        "latest.cost.attendance.academic_year": 23000,
+        "latest.admissions.admission_rate.overall": 0.23,
+        "latest.completion.completion_rate_4yr_150nt": 0.88,
+        "latest.student.size": 56567,
+        "latest.cost.avg_net_price.overall": 9200
+    },
+    "Florida Atlantic University": {
+        "id": 133951,
+        "school.name": "Florida Atlantic University",
+        "school.city": "Boca Raton",
+        "school.state": "FL",
+        "latest.cost.tuition.in_state": 4879,
+        "latest.cost.tuition.out_of_state": 17324,
+        "latest.cost.attendance.academic_year": 19000,
+        "latest.admissions.admission_rate.overall": 0.59,
+        "latest.completion.completion_rate_4yr_150nt": 0.47,
+        "latest.student.size": 30808,
+        "latest.cost.avg_net_price.overall": 7500
+    },
+    "University of Central Florida": {
+        "id": 132903,
+        "school.name": "University of Central Florida",
+        "school.city": "Orlando",
+        "school.state": "FL",
+        "latest.cost.tuition.in_state": 6368,
+        "latest.cost.tuition.out_of_state": 22467,
+        "latest.cost.attendance.academic_year": 21000,
+        "latest.admissions.admission_rate.overall": 0.44,
+        "latest.completion.completion_rate_4yr_150nt": 0.70,
+        "latest.student.size": 68571,
+        "latest.cost.avg_net_price.overall": 8200
+    },
+    "Georgia Institute of Technology": {
+        "id": 139959,
+        "school.name": "Georgia Institute of Technology-Main Campus",
+        "school.city": "Atlanta",
+        "school.state": "GA",
+        "latest.cost.tuition.in_state": 12682,
+        "latest.cost.tuition.out_of_state": 33794,
+        "latest.cost.attendance.academic_year": 29000,
+        "latest.admissions.admission_rate.overall": 0.16,
+        "latest.completion.completion_rate_4yr_150nt": 0.87,
+        "latest.student.size": 39771,
+        "latest.cost.avg_net_price.overall": 14000
+    },
+    "Massachusetts Institute of Technology": {
+        "id": 166683,
+        "school.name": "Massachusetts Institute of Technology",
+        "school.city": "Cambridge",
+        "school.state": "MA",
+        "latest.cost.tuition.in_state": 57986,
+        "latest.cost.tuition.out_of_state": 57986,
+        "latest.cost.attendance.academic_year": 77020,
+        "latest.admissions.admission_rate.overall": 0.04,
+        "latest.completion.completion_rate_4yr_150nt": 0.94,
+        "latest.student.size": 11934,
+        "latest.cost.avg_net_price.overall": 19619
+    },
+    "Stanford University": {
+        "id": 243744,
+        "school.name": "Stanford University",
+        "school.city": "Stanford",
+        "school.state": "CA",
+        "latest.cost.tuition.in_state": 59339,
+        "latest.cost.tuition.out_of_state": 59339,
+        "latest.cost.attendance.academic_year": 82406,
+        "latest.admissions.admission_rate.overall": 0.04,
+        "latest.completion.completion_rate_4yr_150nt": 0.95,
+        "latest.student.size": 17651,
+        "latest.cost.avg_net_price.overall": 18279
+    },
+    "Carnegie Mellon University": {
+        "id": 211440,
+        "school.name": "Carnegie Mellon University",
+        "school.city": "Pittsburgh",
+        "school.state": "PA",
+        "latest.cost.tuition.in_state": 61344,
+        "latest.cost.tuition.out_of_state": 61344,
+        "latest.cost.attendance.academic_year": 79196,
+        "latest.admissions.admission_rate.overall": 0.11,
+        "latest.completion.completion_rate_4yr_150nt": 0.91,
+        "latest.student.size": 15818,
+        "latest.cost.avg_net_price.overall": 27558
+    },
+    "University of California Berkeley": {
+        "id": 110635,
+        "school.name": "University of California-Berkeley",
+        "school.city": "Berkeley",
+        "school.state": "CA",
+        "latest.cost.tuition.in_state": 14254,
+        "latest.cost.tuition.out_of_state": 44008,
+        "latest.cost.attendance.academic_year": 39040,
+        "latest.admissions.admission_rate.overall": 0.11,
+        "latest.completion.completion_rate_4yr_150nt": 0.92,
+        "latest.student.size": 42519,
+        "latest.cost.avg_net_price.overall": 16702
+    },
+    "Arizona State University": {
+        "id": 104151,
+        "school.name": "Arizona State University-Tempe",
+        "school.city": "Tempe",
+        "school.state": "AZ",
+        "latest.cost.tuition.in_state": 11618,
+        "latest.cost.tuition.out_of_state": 29428,
+        "latest.cost.attendance.academic_year": 28384,
+        "latest.admissions.admission_rate.overall": 0.88,
+        "latest.completion.completion_rate_4yr_150nt": 0.67,
+        "latest.student.size": 65492,
+        "latest.cost.avg_net_price.overall": 13897
+    }
+}
+
+# Generic estimates for institutions without seed data (school.name is filled in per call)
+_GENERIC_COLLEGE_DATA = {
+    "id": 0,
+    "school.name": "",
+    "school.city": "Unknown",
+    "school.state": "FL",
+    "latest.cost.tuition.in_state": 8000,
+    "latest.cost.tuition.out_of_state": 20000,
+    "latest.cost.attendance.academic_year": 18000,
+    "latest.admissions.admission_rate.overall": 0.5,
+    "latest.completion.completion_rate_4yr_150nt": 0.4,
+    "latest.student.size": 10000,
+    "latest.cost.avg_net_price.overall": 10000
+}
 
 
 def _get_fallback_college_data(institution_name: str) -> Optional[Dict]:
@@ -221,173 +627,37 @@ def _get_fallback_college_data(institution_name: str) -> Optional[Dict]:
     Fallback college data when API key is not available.
     Returns realistic seed data for common Florida institutions.
     """
-    fallback_data = {
-        "Florida International University": {
-            "id": 133951,
-            "school.name": "Florida International University",
-            "school.city": "Miami",
-            "school.state": "FL",
-            "latest.cost.tuition.in_state": 6565,
-            "latest.cost.tuition.out_of_state": 18566,
-            "latest.cost.attendance.academic_year": 21000,
-            "latest.admissions.admission_rate.overall": 0.64,
-            "latest.completion.completion_rate_4yr_150nt": 0.52,
-            "latest.student.size": 56851,
-            "latest.cost.avg_net_price.overall": 8500
-        },
-        "Miami Dade College": {
-            "id": 135726,
-            "school.name": "Miami Dade College",
-            "school.city": "Miami",
-            "school.state": "FL",
-            "latest.cost.tuition.in_state": 3400,
-            "latest.cost.tuition.out_of_state": 12000,
-            "latest.cost.attendance.academic_year": 10000,
-            "latest.admissions.admission_rate.overall": 1.0,
-            "latest.completion.completion_rate_4yr_150nt": 0.23,
-            "latest.student.size": 50000,
-            "latest.cost.avg_net_price.overall": 4200
-        },
-        "University of Florida": {
-            "id": 134130,
-            "school.name": "University of Florida",
-            "school.city": "Gainesville",
-            "school.state": "FL",
-            "latest.cost.tuition.in_state": 6380,
-            "latest.cost.tuition.out_of_state": 28658,
-            "latest.cost.attendance.academic_year": 23000,
-            "latest.admissions.admission_rate.overall": 0.23,
-            "latest.completion.completion_rate_4yr_150nt": 0.88,
-            "latest.student.size": 56567,
-            "latest.cost.avg_net_price.overall": 9200
-        },
-        "Florida Atlantic University": {
-            "id": 133951,
-            "school.name": "Florida Atlantic University",
-            "school.city": "Boca Raton",
-            "school.state": "FL",
-            "latest.cost.tuition.in_state": 4879,
-            "latest.cost.tuition.out_of_state": 17324,
-            "latest.cost.attendance.academic_year": 19000,
-            "latest.admissions.admission_rate.overall": 0.59,
-            "latest.completion.completion_rate_4yr_150nt": 0.47,
-            "latest.student.size": 30808,
-            "latest.cost.avg_net_price.overall": 7500
-        },
-        "University of Central Florida": {
-            "id": 132903,
-            "school.name": "University of Central Florida",
-            "school.city": "Orlando",
-            "school.state": "FL",
-            "latest.cost.tuition.in_state": 6368,
-            "latest.cost.tuition.out_of_state": 22467,
-            "latest.cost.attendance.academic_year": 21000,
-            "latest.admissions.admission_rate.overall": 0.44,
-            "latest.completion.completion_rate_4yr_150nt": 0.70,
-            "latest.student.size": 68571,
-            "latest.cost.avg_net_price.overall": 8200
-        },
-        "Georgia Institute of Technology": {
-            "id": 139959,
-            "school.name": "Georgia Institute of Technology-Main Campus",
-            "school.city": "Atlanta",
-            "school.state": "GA",
-            "latest.cost.tuition.in_state": 12682,
-            "latest.cost.tuition.out_of_state": 33794,
-            "latest.cost.attendance.academic_year": 29000,
-            "latest.admissions.admission_rate.overall": 0.16,
-            "latest.completion.completion_rate_4yr_150nt": 0.87,
-            "latest.student.size": 39771,
-            "latest.cost.avg_net_price.overall": 14000
-        },
-        "Massachusetts Institute of Technology": {
-            "id": 166683,
-            "school.name": "Massachusetts Institute of Technology",
-            "school.city": "Cambridge",
-            "school.state": "MA",
-            "latest.cost.tuition.in_state": 57986,
-            "latest.cost.tuition.out_of_state": 57986,
-            "latest.cost.attendance.academic_year": 77020,
-            "latest.admissions.admission_rate.overall": 0.04,
-            "latest.completion.completion_rate_4yr_150nt": 0.94,
-            "latest.student.size": 11934,
-            "latest.cost.avg_net_price.overall": 19619
-        },
-        "Stanford University": {
-            "id": 243744,
-            "school.name": "Stanford University",
-            "school.city": "Stanford",
-            "school.state": "CA",
-            "latest.cost.tuition.in_state": 59339,
-            "latest.cost.tuition.out_of_state": 59339,
-            "latest.cost.attendance.academic_year": 82406,
-            "latest.admissions.admission_rate.overall": 0.04,
-            "latest.completion.completion_rate_4yr_150nt": 0.95,
-            "latest.student.size": 17651,
-            "latest.cost.avg_net_price.overall": 18279
-        },
-        "Carnegie Mellon University": {
-            "id": 211440,
-            "school.name": "Carnegie Mellon University",
-            "school.city": "Pittsburgh",
-            "school.state": "PA",
-            "latest.cost.tuition.in_state": 61344,
-            "latest.cost.tuition.out_of_state": 61344,
-            "latest.cost.attendance.academic_year": 79196,
-            "latest.admissions.admission_rate.overall": 0.11,
-            "latest.completion.completion_rate_4yr_150nt": 0.91,
-            "latest.student.size": 15818,
-            "latest.cost.avg_net_price.overall": 27558
-        },
-        "University of California Berkeley": {
-            "id": 110635,
-            "school.name": "University of California-Berkeley",
-            "school.city": "Berkeley",
-            "school.state": "CA",
-            "latest.cost.tuition.in_state": 14254,
-            "latest.cost.tuition.out_of_state": 44008,
-            "latest.cost.attendance.academic_year": 39040,
-            "latest.admissions.admission_rate.overall": 0.11,
-            "latest.completion.completion_rate_4yr_150nt": 0.92,
-            "latest.student.size": 42519,
-            "latest.cost.avg_net_price.overall": 16702
-        },
-        "Arizona State University": {
-            "id": 104151,
-            "school.name": "Arizona State University-Tempe",
-            "school.city": "Tempe",
-            "school.state": "AZ",
-            "latest.cost.tuition.in_state": 11618,
-            "latest.cost.tuition.out_of_state": 29428,
-            "latest.cost.attendance.academic_year": 28384,
-            "latest.admissions.admission_rate.overall": 0.88,
-            "latest.completion.completion_rate_4yr_150nt": 0.67,
-            "latest.student.size": 65492,
-            "latest.cost.avg_net_price.overall": 13897
-        }
-    }
-
-    # Check for exact match
-    if institution_name in fallback_data:
-        return fallback_data[institution_name]
-
-    # Check normalized name
-    normalized = normalize_institution_name(institution_name)
-    if normalized in fallback_data:
-        return fallback_data[normalized]
+    # Check exact match, then normalized name
+    data = _FALLBACK_COLLEGE_DATA.get(institution_name)
+    if data is None:
+        data = _FALLBACK_COLLEGE_DATA.get(normalize_institution_name(institution_name))
+    if data is not None:
+        # Copy, so callers never mutate the shared seed record
+        return dict(data)
 
     # Return generic fallback
     print(f"No fallback data for: {institution_name}. Using generic estimates.")
-    return {
-        "id": 0,
-        "school.name": institution_name,
-        "school.city": "Unknown",
-        "school.state": "FL",
-        "latest.cost.tuition.in_state": 8000,
-        "latest.cost.tuition.out_of_state": 20000,
-        "latest.cost.attendance.academic_year": 18000,
-        "latest.admissions.admission_rate.overall": 0.5,
-        "latest.completion.completion_rate_4yr_150nt": 0.4,
-        "latest.student.size": 10000,
-        "latest.cost.avg_net_price.overall": 10000
-    }
+    return {**_GENERIC_COLLEGE_DATA, "school.name": institution_name}
+
+
+# Institutions nearly every roadmap touches; prefetched at import when enabled
+WARM_INSTITUTIONS = (
+    "Florida International University",
+    "Miami Dade College",
+    "University of Florida",
+    "University of Central Florida",
+    "Florida Atlantic University",
+)
+
+
+def _warm_cache() -> None:
+    """Prefetch WARM_INSTITUTIONS (one batched request) so first queries hit the memo"""
+    try:
+        get_multiple_college_costs(list(WARM_INSTITUTIONS))
+    except Exception as e:
+        print(f"College Scorecard cache warm-up failed: {e}")
+
+
+# Opt-in: only useful (and only touches the network) when an API key is configured
+if _SCORECARD_API_KEY and os.getenv("CAREERPILOT_WARM_CACHE") == "1":
+    threading.Thread(target=_warm_cache, name="scorecard-warm-cache", daemon=True).start()
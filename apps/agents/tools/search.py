@@ -2,26 +2,103 @@
 Google Programmable Custom Search wrapper
 Searches only trusted education domains
 """
+import asyncio
+import functools
 import os
-import requests
-from typing import List, Dict, Optional
-from dotenv import load_dotenv
-
-load_dotenv()
+import re
+import orjson
+from typing import TYPE_CHECKING, List, Dict, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+from _paths import cache_dir, load_env
+from tools._aio import run_sync
+from tools.cache import JsonDiskCache, TTLMemo
+
+if TYPE_CHECKING:
+    import requests
+
+load_env()
+
+# Read once at import; call reload_env() after changing the environment
+_GOOGLE_KEY = os.getenv("GOOGLE_SEARCH_API_KEY")
+_GOOGLE_CX = os.getenv("GOOGLE_SEARCH_ENGINE_ID")
+
+
+def reload_env() -> None:
+    """Re-load .env and re-read the Google search credentials (for tests that change them)"""
+    global _GOOGLE_KEY, _GOOGLE_CX
+    load_env(override=True)
+    _GOOGLE_KEY = os.getenv("GOOGLE_SEARCH_API_KEY")
+    _GOOGLE_CX = os.getenv("GOOGLE_SEARCH_ENGINE_ID")
+    _search_memo.clear()
+
+
+# requests/httpx are imported on first API call, keeping them off the import path
+@functools.lru_cache(maxsize=1)
+def _session() -> "requests.Session":
+    """Shared session so repeated searches reuse pooled keep-alive connections"""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    ))
+    return session
+
+
+SEARCH_API_URL = "https://www.googleapis.com/customsearch/v1"
+# Custom Search serves at most 10 results per request and 100 per query
+SEARCH_PAGE_SIZE = 10
+SEARCH_MAX_RESULTS = 100
+
+# Identical queries recur across agent turns; successful responses are
+# memoized in-process and cached on disk for an hour
+SEARCH_CACHE_DIR = cache_dir("search")
+SEARCH_MEMO_TTL = 60 * 60
+_search_memo = TTLMemo(maxsize=512, ttl_seconds=SEARCH_MEMO_TTL)
+_search_cache = JsonDiskCache(SEARCH_CACHE_DIR, SEARCH_MEMO_TTL)
+
+# Default trusted domains
+DEFAULT_SITE_RESTRICTIONS = (
+    "mdc.edu",
+    "fiu.edu",
+    "fau.edu",
+    "ucf.edu",
+    "uf.edu",
+    "floridashines.org",
+    "ed.gov"
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _site_query_for(domains: Tuple[str, ...]) -> str:
+    """Build the "site:a OR site:b" restriction clause for a set of domains"""
+    return " OR ".join([f"site:{domain}" for domain in domains])
+
+
+_DEFAULT_SITE_QUERY = _site_query_for(DEFAULT_SITE_RESTRICTIONS)
 
 
 def search_education_sites(
     query: str,
     num_results: int = 10,
-    site_restrictions: Optional[List[str]] = None
+    site_restrictions: Optional[Sequence[str]] = None
 ) -> List[Dict]:
     """
     Search only trusted educational institution domains.
 
     Args:
         query: Search query
-        num_results: Number of results to return (max 10 per request)
-        site_restrictions: List of domains to restrict to
+        num_results: Number of results to return (the API serves 10 per request and
+            100 per query; larger requests fetch their pages concurrently)
+        site_restrictions: Domains to restrict to (defaults to DEFAULT_SITE_RESTRICTIONS)
 
     Returns:
         List of search results with title, link, snippet
@@ -30,67 +107,113 @@ def search_education_sites(
         >>> results = search_education_sites("mechanical engineering program")
         >>> print(results[0]["title"])
     """
-    api_key = os.getenv("GOOGLE_SEARCH_API_KEY")
-    engine_id = os.getenv("GOOGLE_SEARCH_ENGINE_ID")
-
-    if not api_key or not engine_id:
+    if not _GOOGLE_KEY or not _GOOGLE_CX:
         raise ValueError(
             "Missing GOOGLE_SEARCH_API_KEY or GOOGLE_SEARCH_ENGINE_ID in environment"
         )
 
-    # Default trusted domains
-    if site_restrictions is None:
-        site_restrictions = [
-            "mdc.edu",
-            "fiu.edu",
-            "fau.edu",
-            "ucf.edu",
-            "uf.edu",
-            "floridashines.org",
-            "ed.gov"
-        ]
-
     # Build site restriction query
-    site_query = " OR ".join([f"site:{domain}" for domain in site_restrictions])
+    if site_restrictions is None:
+        site_query = _DEFAULT_SITE_QUERY
+    else:
+        site_query = _site_query_for(tuple(site_restrictions))
     full_query = f"{query} {site_query}"
 
-    url = "https://www.googleapis.com/customsearch/v1"
     params = {
-        "key": api_key,
-        "cx": engine_id,
+        "key": _GOOGLE_KEY,
+        "cx": _GOOGLE_CX,
         "q": full_query,
-        "num": min(num_results, 10)  # API limit is 10 per request
+        "num": min(num_results, SEARCH_PAGE_SIZE)  # API limit is 10 per request
     }
+    total = min(num_results, SEARCH_MAX_RESULTS)
+
+    memo_key = (full_query, total)
+    cached = _search_memo.get(memo_key)
+    if cached is None:
+        cached = _search_cache.get(memo_key)
+        if cached is not None:
+            _search_memo.set(memo_key, cached)
+    if cached is not None:
+        return _copy_results(cached)
+
+    if total <= SEARCH_PAGE_SIZE:
+        import requests
+
+        try:
+            response = _session().get(SEARCH_API_URL, params=params, timeout=10)
+            response.raise_for_status()
+            items = orjson.loads(response.content).get("items", [])
+
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            print(f"Search API error: {e}")
+            return []
+        complete = True
+    else:
+        pages = run_sync(_search_pages_async(params, total))
+        complete = None not in pages
+        items = [item for page in pages if page for item in page][:total]
+
+    results = [
+        {
+            "title": item.get("title", ""),
+            "link": item.get("link", ""),
+            "snippet": item.get("snippet", ""),
+            "domain": extract_domain(item.get("link", ""))
+        }
+        for item in items
+    ]
+    # Partial results (a page failed) are returned but not memoized
+    if complete:
+        _search_memo.set(memo_key, results)
+        _search_cache.set(memo_key, results)
+        return _copy_results(results)
+    return results
+
+
+def _copy_results(results: List[Dict]) -> List[Dict]:
+    """Fresh list of fresh dicts, so callers can edit results without touching the memo"""
+    return [dict(result) for result in results]
+
+
+async def _search_pages_async(params: Dict, total: int) -> List[Optional[List[Dict]]]:
+    """
+    Fetch result pages 1, 11, 21, ... concurrently over one client.
 
-    try:
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+    Returns:
+        Raw items per page, in order (None for a page that failed)
+    """
+    import httpx
 
-        if "items" not in data:
-            return []
+    async def fetch_page(client: httpx.AsyncClient, start: int) -> Optional[List[Dict]]:
+        page_params = {**params, "start": start, "num": min(SEARCH_PAGE_SIZE, total - start + 1)}
+        try:
+            response = await client.get(SEARCH_API_URL, params=page_params)
+            response.raise_for_status()
+            return orjson.loads(response.content).get("items", [])
 
-        return [
-            {
-                "title": item.get("title", ""),
-                "link": item.get("link", ""),
-                "snippet": item.get("snippet", ""),
-                "domain": extract_domain(item.get("link", ""))
-            }
-            for item in data["items"]
-        ]
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+            print(f"Search API error: {e}")
+            return None
 
-    except requests.exceptions.RequestException as e:
-        print(f"Search API error: {e}")
-        return []
+    async with httpx.AsyncClient(timeout=10, transport=httpx.AsyncHTTPTransport(retries=3)) as client:
+        return await asyncio.gather(*[
+            fetch_page(client, start)
+            for start in range(1, total + 1, SEARCH_PAGE_SIZE)
+        ])
+
+
+# Fast path for plain "scheme://host/..." links; anything unusual goes through urlparse
+_PLAIN_DOMAIN_RE = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*://([^/?#\[\]\s]*)(?:[/?#]|$)")
 
 
 def extract_domain(url: str) -> str:
     """Extract domain from URL"""
+    match = _PLAIN_DOMAIN_RE.match(url)
+    if match:
+        return match.group(1)
+
     try:
-        from urllib.parse import urlparse
-        parsed = urlparse(url)
-        return parsed.netloc
+        return urlparse(url).netloc
     except Exception:
         return ""
 